@@ -1,7 +1,7 @@
 # md8800_gui_v8.py
 # MD8800 VFD GUI — v8
 
-import time, datetime, random
+import os, time, datetime, random, contextlib, collections, threading, struct, bisect
 import tkinter as tk
 from tkinter import ttk, messagebox
 import serial, serial.tools.list_ports
@@ -14,27 +14,183 @@ except Exception:
 
 BAUD = 9600
 STOPBITS = serial.STOPBITS_TWO
+LINE_WIDTH = 16   # characters per text line
+TX_QUEUE_MAX = 256   # writes waiting for the serial writer thread
+MASTER_MS = 10       # animation scheduler resolution
+SAMPLE_S = 0.5       # sampling period for the system meters
+MEM_BACKOFF_S = 5.0  # longest gap between RAM samples while its level holds still
+# meter level = number of thresholds the rate has reached
+_NET_THRESH  = (64_000, 512_000, 5_000_000)   # bits/s -> red bars 0..3
+_DISK_THRESH = (64_000, 256_000, 1_000_000, 4_000_000, 16_000_000, 64_000_000)   # bytes/s -> 0..6
+_DISK_EWMA_SHIFT = 2   # disk rate smoothing: ewma += (rate - ewma) / 4 per sample
+_MEM_LVL = tuple(round(p / 100 * 6) for p in range(101))   # RAM % (rounded) -> 0..6
+# FPS spinbox value (1..60) -> loop period in ms; index 0 unused
+_FPS_MS = tuple(max(10, 1000 // max(1, fps)) for fps in range(61))
+
+# mini-matrix editor cells (px) and colours
+MM_CELL = 20
+MM_ON, MM_OFF = "#29d3c4", "#3a3d42"
+
+# Fixed command frames, built once instead of per call
+_CMD_RESET      = b"\x1F"
+_CMD_CLOCK_SET  = b"\x1B\x00"
+_CMD_CLOCK_24H  = b"\x1B\x01"
+_CMD_CLOCK_12H  = b"\x1B\x02"
+_CMD_CLOCK_STOP = b"\x1B\x03"
+_CMD_CLOCK_MOVE = b"\x1B\x04"
+_CMD_CLOCK_SHOW = b"\x1B\x05"
+_CMD_2LINE      = b"\x1B\x20"
+_CMD_LINE1      = b"\x1B\x21"
+_CMD_LINE2      = b"\x1B\x22"
+_CMD_CLEAR      = b"\x1B\x50"
+_CMD_POS1       = b"\x1B\x51"
+_CMD_DISP_ON    = b"\x1B\x52"
+_CMD_DISP_OFF   = b"\x1B\x53"
+_CMD_DEMO_RAIN  = b"\x1B\x54"
+_CMD_BARS_VERT  = b"\x1B\xF0"
+_CMD_BARS_HORIZ = b"\x1B\xF1"
+_CMD_VERSION    = b"\x1B\xF5"
+_MM_CLEAR       = b"\x1B\x31" + bytes(9)
+_LINE_HEADS     = {_CMD_LINE1 + _CMD_POS1: 0, _CMD_LINE2 + _CMD_POS1: 1}   # line select + pos1
+# clock set payload: minute, hour, day, month, year (16-bit big-endian)
+_STRUCT_CLOCK = struct.Struct(">BBBBH")
+# ESC 30 sub val for every icon sub (0x00..0x1F) and value (0..6)
+_ICON_FRAMES = [[bytes([0x1B, 0x30, sub, val]) for val in range(7)] for sub in range(0x20)]
+# ESC 40 lvl, global brightness 0..5
+_BRIGHT_FRAMES = [bytes([0x1B, 0x40, lvl]) for lvl in range(6)]
+
+# Mini-matrix row mask (bit c = column c) -> bit c moved to bit 8*c. OR-ing
+# _SPREAD[row_r] << r over the 7 rows gives all 9 column bytes in one int,
+# and to_bytes(9, "big") emits them right-to-left as the device wants.
+_SPREAD = [sum(1 << (8*c) for c in range(9) if m >> c & 1) for m in range(512)]
+# the same packed layout for a single cell: _CELL_BIT[r][c] = bit 8*c + r
+_CELL_BIT = [[1 << (8*c + r) for c in range(9)] for r in range(7)]
+# clock-bars column: h rows lit from the top (bit 0), h = 0..7
+_BAR_COL = [(1 << h) - 1 for h in range(8)]
+
+# 63-bit board (cell r,c at bit r*9 + c, used by Game of Life and rain): all
+# cells, and all cells except column 0 / column 8 (to drop bits that wrap
+# between rows on a shift)
+_BOARD_FULL = (1 << 63) - 1
+_BOARD_NOT_C0 = _BOARD_FULL & ~sum(1 << (9*r) for r in range(7))
+_BOARD_NOT_C8 = _BOARD_FULL & ~sum(1 << (9*r + 8) for r in range(7))
 
 def hexstr(bs: bytes) -> str:
-    return " ".join(f"{b:02X}" for b in bs)
+    return bs.hex(" ").upper()
+
+_HEX_SEPS = str.maketrans(",;", "  ")
 
 def parse_hex(s: str) -> bytes:
-    s = s.strip().replace(",", " ").replace(";", " ")
-    if not s: return b""
-    return bytes(int(x, 16) for x in s.split())
+    toks = s.translate(_HEX_SEPS).split()
+    if not toks: return b""
+    # fast path: whole-byte tokens ("1B 30 0a") go through bytes.fromhex in C;
+    # odd-length / "0x" tokens keep the old per-token parse
+    if not any(len(t) & 1 for t in toks):
+        try: return bytes.fromhex("".join(toks))
+        except ValueError: pass
+    return bytes(int(x, 16) for x in toks)
+
+# Linux fast path for the net/disk meters: read the kernel counters straight
+# from procfs through a kept-open fd (pread at offset 0 regenerates the file),
+# instead of psutil building a namedtuple per device every sample
+_PROC_FDS = {}
+_WHOLE_DISK = {}    # diskstats name -> counts toward the total (physical whole disk)
+_VIRTUAL_DISKS = ("loop", "ram", "zram", "dm-", "md", "nbd")   # never real disk I/O
+
+def _proc_read(path: str) -> bytes:
+    fd = _PROC_FDS.get(path)
+    if fd is None:
+        fd = _PROC_FDS[path] = os.open(path, os.O_RDONLY)
+    chunks, off = [], 0
+    while True:
+        b = os.pread(fd, 65536, off)
+        if not b: return b"".join(chunks)
+        chunks.append(b); off += len(b)
+
+def _is_whole_disk(name: str) -> bool:
+    # partitions (not in /sys/block) and RAID/device-mapper volumes would count
+    # their disks' I/O twice, zram is swap in RAM: only block devices backed by
+    # hardware (those with a /sys/block/<name>/device link) count
+    ok = _WHOLE_DISK.get(name)
+    if ok is None:
+        ok = _WHOLE_DISK[name] = (not name.startswith(_VIRTUAL_DISKS)
+                                  and os.path.exists(f"/sys/block/{name}/device"))
+    return ok
+
+def _proc_disk_bytes() -> int:
+    # sectors read (field 5) + written (field 9); diskstats sectors are always 512 bytes
+    total = 0
+    for ln in _proc_read("/proc/diskstats").split(b"\n"):
+        f = ln.split()
+        if len(f) > 9 and _is_whole_disk(f[2].decode()):
+            total += int(f[5]) + int(f[9])
+    return total * 512
+
+def _proc_net_bytes() -> int:
+    # rx bytes + tx bytes over all interfaces (the two header lines have no counters)
+    total = 0
+    for ln in _proc_read("/proc/net/dev").split(b"\n")[2:]:
+        _, sep, rest = ln.partition(b":")
+        f = rest.split()
+        if sep and len(f) > 8:
+            total += int(f[0]) + int(f[8])
+    return total
+
+def _psutil_disk_bytes() -> int:
+    # nowrap=False: skip psutil's per-call wrap bookkeeping, the sampler copes
+    dio = psutil.disk_io_counters(nowrap=False)
+    return (dio.read_bytes + dio.write_bytes) if dio else 0
+
+def _psutil_net_bytes() -> int:
+    nio = psutil.net_io_counters(nowrap=False)
+    return nio.bytes_recv + nio.bytes_sent
+
+def _hyst_level(thresh, v: int, lvl: int) -> int:
+    # like bisect_right(thresh, v), but the level only moves once v is 20%
+    # past a threshold, so a rate hovering at a band edge doesn't flap
+    while lvl < len(thresh) and v * 5 >= thresh[lvl] * 6: lvl += 1
+    while lvl > 0 and v * 5 < thresh[lvl - 1] * 4: lvl -= 1
+    return lvl
+
+def _pick_reader(fast, fallback):
+    try:
+        fast(); return fast
+    except (OSError, ValueError, IndexError):
+        return fallback
 
 class VFD:
     def __init__(self, log_cb):
         self.s = None
         self.log = log_cb
+        self.log_tx = True      # False: skip formatting/logging of TX frames
+        self._pending = bytearray()   # TX bytes held back while a batch is open
+        self._pending_notes = []
+        self._pending_drop = True     # every part of the batch is droppable
+        self._batch_drop = False      # batch opened as one self-contained frame
+        self._tx_depth = 0
+        # Writes are queued for a daemon thread that owns the port, so a slow
+        # or stalled link never blocks Tk. Entries are (bytes, droppable).
+        self._tx_q = collections.deque()
+        self._tx_cv = threading.Condition()
+        self._tx_thread = None
+        self._tx_stop = None    # stop event of the current writer (each writer gets its own)
+        self._icon_state = {}   # sub -> last value sent (ESC 30 sub val)
+        self._mm_last = None    # last mini-matrix frame sent
+        self._text_last = {}    # line -> last draw_text_line payload
 
     def open(self, port: str):
+        if self.s: self.close()   # never leave a second writer on the queue
         try:
             self.s = serial.Serial(
                 port=port, baudrate=BAUD, bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE, stopbits=STOPBITS,
                 timeout=0.3, write_timeout=0.5
             )
+            self.invalidate_caches()
+            self._tx_stop = threading.Event()
+            self._tx_thread = threading.Thread(target=self._writer, args=(self.s, self._tx_stop),
+                                               daemon=True)
+            self._tx_thread.start()
             self.log(f"[connected] {port} @ {BAUD} 8N2")
         except Exception as e:
             self.log(f"[error] open: {e}")
@@ -42,106 +198,244 @@ class VFD:
 
     def close(self):
         if self.s:
+            with self._tx_cv:
+                self._tx_stop.set(); self._tx_cv.notify_all()
+            if self._tx_thread:
+                self._tx_thread.join(timeout=1.0); self._tx_thread = None
             try: self.s.close()
             except: pass
             self.s = None
+            self._pending.clear(); self._pending_notes.clear()
+            self._tx_q.clear()
             self.log("[disconnected]")
 
-    def send(self, b: bytes, note=""):
+    def send(self, b: bytes, note="", droppable=False) -> bool:
+        # droppable: a self-contained animation frame that may be discarded
+        # when the TX queue is full (icon/mode state changes never are)
         if not self.s or not self.s.is_open:
-            self.log("[error] not connected"); return
-        try:
-            self.s.write(b)
-            self.log(f"TX: {hexstr(b)}  {note}")
-        except Exception as e:
-            self.log(f"[error] write: {e}")
-
-    def RESET(self): self.send(b"\x1F", "RESET")
+            self.log("[error] not connected"); return False
+        if b[:2] not in (b"\x1B\x30", b"\x1B\x31"):
+            # icon/mm frames never touch the text; a one-line write (line
+            # select + pos1 + up to 16 chars) only touches its own line.
+            # Anything else (demos, bars, display on/off...) may have drawn
+            # over the mini-matrix, so its last frame is forgotten too.
+            self._mm_last = None
+            line = _LINE_HEADS.get(b[:4])
+            if line is not None and len(b) <= 4 + LINE_WIDTH: self._text_last.pop(line, None)
+            else: self._text_last.clear()
+        if self._tx_depth:
+            self._pending += b; self._pending_notes.append(note)
+            self._pending_drop = self._pending_drop and droppable
+            return True
+        return self._write(b, note, droppable)
+
+    def _write(self, b: bytes, note="", droppable=False) -> bool:
+        with self._tx_cv:
+            if len(self._tx_q) >= TX_QUEUE_MAX:
+                # make room by dropping the oldest droppable frame; if there is
+                # none, drop this one if we may, otherwise let the queue grow
+                old = next((i for i, (_, d) in enumerate(self._tx_q) if d), None)
+                if old is not None:
+                    del self._tx_q[old]
+                    self.invalidate_caches()   # the dropped frame may be one they recorded
+                elif droppable:
+                    self.invalidate_caches()
+                    self.log(f"[tx] queue full, dropped: {note}"); return False
+            self._tx_q.append((b, droppable))
+            self._tx_cv.notify()
+        if self.log_tx: self.log(f"TX: {hexstr(b)}  {note}")
+        return True
+
+    def _writer(self, port, stop):
+        # serial writer thread: takes everything queued so far and writes it
+        # as one block, so frames that piled up while the link was busy coalesce.
+        # Once stopped it drains what is left for its own port and exits; a
+        # writer that outlived close() (stuck in a slow write) must not take
+        # frames queued for the next connection.
+        while True:
+            with self._tx_cv:
+                while not stop.is_set() and not self._tx_q:
+                    self._tx_cv.wait()
+                if stop.is_set() and (not self._tx_q or port is not self.s): return
+                data = b"".join(b for b, _ in self._tx_q)
+                self._tx_q.clear()
+            try:
+                port.write(data); port.flush()
+            except Exception as e:
+                self.log(f"[error] write: {e}")
+                self.invalidate_caches()   # device state unknown now
+
+    # ---- Batching: everything sent inside one tick goes out as one write ----
+    def begin_batch(self, droppable=False):
+        if not self._tx_depth: self._batch_drop = droppable
+        self._tx_depth += 1
+
+    def end_batch(self):
+        self._tx_depth -= 1
+        if not self._tx_depth: self.flush_pending()
+
+    def flush_pending(self) -> bool:
+        # the one write per batch; the buffer is reused, not reallocated
+        if not self._pending: return True
+        notes = self._pending_notes
+        note = notes[0] if len(notes) == 1 else f"{notes[0]} (+{len(notes)-1} more)"
+        data, droppable = bytes(self._pending), self._batch_drop or self._pending_drop
+        self._pending.clear(); self._pending_notes = []; self._pending_drop = True
+        if not self.s or not self.s.is_open: return False
+        return self._write(data, note, droppable)
+
+    @contextlib.contextmanager
+    def batched(self, droppable=False):
+        self.begin_batch(droppable)
+        try: yield
+        finally: self.end_batch()
+
+    def _raw_bulk(self, frames: bytes, note=""):
+        # several pre-built frames in one write (one USB packet instead of N)
+        return self.send(frames, f"{note} [{len(frames)} B]" if self.log_tx else "")
+
+    def RESET(self):
+        self.invalidate_caches()
+        self.send(_CMD_RESET, "RESET")
     def ESC(self, code: int, *params: int, note=""):
         self.send(bytes([0x1B, code] + list(params)),
-                  f"ESC {code:02X} {' '.join(f'{p:02X}' for p in params)} {note}")
+                  f"ESC {code:02X} {hexstr(bytes(params))} {note}" if self.log_tx else "")
 
     # ---- Core / Modes ----
-    def mode_2line(self):   self.ESC(0x20, note="2-line")
-    def mode_line1(self):   self.ESC(0x21, note="write line1")
-    def mode_line2(self):   self.ESC(0x22, note="write line2")
-    def soft_clear(self):   self.ESC(0x50, note="soft clear")
-    def pos1(self):         self.ESC(0x51, note="pos1 / CR")
-    def display_on(self):   self.ESC(0x52, note="display ON")
-    def display_off(self):  self.ESC(0x53, note="display OFF")
-    def demo_rain(self):    self.ESC(0x54, note="demo rain")
-    def bars_vert(self):    self.ESC(0xF0, note="bars vertical")
-    def bars_horiz(self):   self.ESC(0xF1, note="bars horizontal")
-    def prod_version(self): self.ESC(0xF5, note="product/version")
+    def mode_2line(self):   self.send(_CMD_2LINE, "2-line")
+    def mode_line1(self):   self.send(_CMD_LINE1, "write line1")
+    def mode_line2(self):   self.send(_CMD_LINE2, "write line2")
+    def soft_clear(self):
+        self.invalidate_caches()
+        self.send(_CMD_CLEAR, "soft clear")
+    def pos1(self):         self.send(_CMD_POS1, "pos1 / CR")
+    def display_on(self):   self.send(_CMD_DISP_ON, "display ON")
+    def display_off(self):  self.send(_CMD_DISP_OFF, "display OFF")
+    def demo_rain(self):    self.send(_CMD_DEMO_RAIN, "demo rain")
+    def bars_vert(self):    self.send(_CMD_BARS_VERT, "bars vertical")
+    def bars_horiz(self):   self.send(_CMD_BARS_HORIZ, "bars horizontal")
+    def prod_version(self): self.send(_CMD_VERSION, "product/version")
     def set_brightness(self, level:int):
         lvl = max(0, min(5, int(level)))
-        self.ESC(0x40, lvl, note=f"brightness {lvl}")
+        self.send(_BRIGHT_FRAMES[lvl], f"brightness {lvl}")
 
     def write_text(self, s: str):
         data = s.encode("ascii", "ignore")
         self.send(data, f'"{s}"')
+    def draw_text_line(self, line: int, s: str):
+        # select line + pos1 + text in one frame; skipped if the line already shows it
+        data = (_CMD_LINE1 if line == 0 else _CMD_LINE2) + _CMD_POS1 + s[:LINE_WIDTH].encode("ascii", "ignore")
+        if self._text_last.get(line) == data: return True
+        ok = self.send(data, f'line{line} "{s}"')
+        if ok: self._text_last[line] = data
+        return ok
 
     # ---- Clock ----
-    def clock_24h(self):  self.ESC(0x01, note="24h clock")
-    def clock_12h(self):  self.ESC(0x02, note="12h clock")
-    def clock_stop(self): self.ESC(0x03, note="clock stop move")
-    def clock_move(self): self.ESC(0x04, note="clock move")
-    def clock_show(self): self.ESC(0x05, note="clock show")
+    def clock_24h(self):  self.send(_CMD_CLOCK_24H, "24h clock")
+    def clock_12h(self):  self.send(_CMD_CLOCK_12H, "12h clock")
+    def clock_stop(self): self.send(_CMD_CLOCK_STOP, "clock stop move")
+    def clock_move(self): self.send(_CMD_CLOCK_MOVE, "clock move")
+    def clock_show(self): self.send(_CMD_CLOCK_SHOW, "clock show")
     def clock_set(self, dt: datetime.datetime):
         m,h,d,mo,y = dt.minute, dt.hour, dt.day, dt.month, dt.year
-        self.ESC(0x00, m, h, d, mo, (y>>8)&0xFF, y&0xFF,
-                 note=f"clock set {h:02d}:{m:02d} {d:02d}.{mo:02d}.{y}")
+        self.send(_CMD_CLOCK_SET + _STRUCT_CLOCK.pack(m, h, d, mo, y),
+                  f"clock set {h:02d}:{m:02d} {d:02d}.{mo:02d}.{y}")
+
+    # Icon, mini-matrix and text-line caches let unchanged state skip the
+    # wire; drop them whenever the device may no longer match.
+    def invalidate_caches(self):
+        self._icon_state.clear()
+        self._mm_last = None
+        self._text_last.clear()
 
     # ---- Icons (ESC 30 sub val) ----
-    def icon_brightness(self, sub:int, level:int):
-        lvl = max(0, min(6, int(level)))
-        self.ESC(0x30, sub & 0xFF, lvl & 0xFF, note=f"icon {sub:02X} brightness {lvl}")
-    def icon_bool(self, sub:int, on:bool):
-        self.ESC(0x30, sub & 0xFF, 0x01 if on else 0x00,
-                 note=f"icon {sub:02X} {'ON' if on else 'OFF'}")
+    # Only icons whose value differs from the last one sent go on the wire.
+    # note is a callable building the log text, so nothing is formatted for
+    # the (many) animation ticks that change nothing or run with logging off.
+    # force (UI controls) sends every given icon, so a user can re-assert a
+    # state the display lost (e.g. power-cycled behind an open adapter).
+
+    def _icon_update(self, states: dict, note, force=False):
+        changed = states if force else {sub: val for sub, val in states.items()
+                                        if self._icon_state.get(sub) != val}
+        if not changed: return
+        note = note() if self.log_tx else ""
+        if len(changed) == 1:
+            (sub, val), = changed.items()
+            ok = self.send(_ICON_FRAMES[sub][val], note)
+        else:
+            ok = self._raw_bulk(b"".join(_ICON_FRAMES[sub][val] for sub, val in changed.items()), note)
+        if ok: self._icon_state.update(changed)
 
-    def set_record(self, on:bool):      self.icon_bool(0x08, on)
+    def icon_brightness(self, sub:int, level:int, force=False):
+        lvl = max(0, min(6, int(level)))
+        self._icon_update({sub & 0xFF: lvl}, lambda: f"icon {sub:02X} brightness {lvl}", force)
+    def icon_brightness_batch(self, pairs):
+        # (sub, level) pairs; the changed ones go out in one write
+        states = {sub & 0xFF: max(0, min(6, int(l))) for sub, l in pairs}
+        self._icon_update(states, lambda: "icon brightness " + " ".join(f"{s:02X}={l}" for s, l in states.items()))
+    def icon_brightness_bulk(self, levels):
+        # levels for subs 0x00..0x07 (HDD..Photo)
+        self.icon_brightness_batch(enumerate(levels))
+    def icon_bool(self, sub:int, on:bool, force=False):
+        self._icon_update({sub & 0xFF: 0x01 if on else 0x00},
+                          lambda: f"icon {sub:02X} {'ON' if on else 'OFF'}", force)
+
+    def set_record(self, on:bool, force=False):      self.icon_bool(0x08, on, force)
     # Email mapping: white 0x09, red 0x0A
-    def set_email_white(self, on:bool): self.icon_bool(0x09, on)
-    def set_email_red(self, on:bool):   self.icon_bool(0x0A, on)
+    def set_email_white(self, on:bool, force=False): self.icon_bool(0x09, on, force)
+    def set_email_red(self, on:bool, force=False):   self.icon_bool(0x0A, on, force)
 
     # Speaker / Muted
-    def set_speaker_mode(self, mode:int):
+    def set_speaker_mode(self, mode:int, force=False):
         # 0 off, 1 muted (0x14), 2 speaker (0x13)
-        self.icon_bool(0x13, mode == 2)
-        self.icon_bool(0x14, mode == 1)
+        self._icon_update({0x13: int(mode == 2), 0x14: int(mode == 1)},
+                          lambda: f"speaker mode {mode}", force)
 
     # Volume bars 0..8 -> 0x0B..0x11 plus 0x12 red underbar
-    def set_volume_level(self, level:int):
+    def set_volume_level(self, level:int, force=False):
         lvl = max(0, min(8, int(level)))
-        for sub in (0x0B,0x0C,0x0D,0x0E,0x0F,0x10,0x11,0x12):
-            self.icon_bool(sub, False)
-        bar_ids = (0x0B,0x0C,0x0D,0x0E,0x0F,0x10,0x11)
-        for i in range(min(lvl, 7)):
-            self.icon_bool(bar_ids[i], True)
-        self.icon_bool(0x12, lvl == 8)
+        states = {sub: int(i < lvl) for i, sub in enumerate((0x0B,0x0C,0x0D,0x0E,0x0F,0x10,0x11))}
+        states[0x12] = int(lvl == 8)
+        self._icon_update(states, lambda: f"volume {lvl}", force)
 
     # Red bars 0..3
-    def set_wifi_level(self, level:int):
+    def set_wifi_level(self, level:int, force=False):
         lvl = max(0, min(3, int(level)))
-        for sub in (0x15,0x16,0x17):
-            self.icon_bool(sub, False)
-        if lvl >= 1: self.icon_bool(0x15, True)
-        if lvl >= 2: self.icon_bool(0x16, True)
-        if lvl >= 3: self.icon_bool(0x17, True)
+        self._icon_update({sub: int(i < lvl) for i, sub in enumerate((0x15,0x16,0x17))},
+                          lambda: f"red bars {lvl}", force)
 
     # Boxes 0..4 -> 0x18..0x1C
-    def set_box(self, which:int, on:bool):
-        self.icon_bool(0x18 + which, on)
+    def set_box(self, which:int, on:bool, force=False):
+        self.icon_bool(0x18 + which, on, force)
 
     # Mini-matrix (ESC 31 + 9 cols). Device wants RIGHT->LEFT columns.
     # Vertical: top row is bit0 on this unit.
-    def mm_send_cols(self, cols9_left_to_right):
+    def _mm_frame(self, frame: bytes, force=False):
+        # animation ticks skip a frame identical to the last one sent; force
+        # (user sends from the editor/presets) always goes out and isn't droppable
+        if frame == self._mm_last and not force: return True
+        ok = self.send(frame, "mm frame", droppable=not force)
+        if ok: self._mm_last = frame
+        return ok
+    def mm_send_cols(self, cols9_left_to_right, force=False):
         cols = list(cols9_left_to_right)
         cols.reverse()
-        self.send(bytes([0x1B,0x31] + [c & 0x7F for c in cols]), "mm frame")
+        self._mm_frame(bytes([0x1B,0x31] + [c & 0x7F for c in cols]), force)
+    def mm_send_grid(self, rows):
+        # rows: 7 row masks, top row first, bit c = column c (left->right)
+        acc = 0
+        for r, row in enumerate(rows):
+            acc |= _SPREAD[row & 0x1FF] << r
+        self.mm_send_packed(acc)
+    def mm_send_board(self, board: int):
+        # board: 63-bit int, cell (r,c) at bit r*9 + c
+        self.mm_send_grid([(board >> (9*r)) & 0x1FF for r in range(7)])
+    def mm_send_packed(self, bits: int):
+        # bits: all 9 column bytes in one int, column c in bits 8*c..8*c+6
+        self._mm_frame(b"\x1B\x31" + bits.to_bytes(9, "big"))
     def mm_clear(self):
-        self.send(b"\x1B\x31" + bytes([0]*9), "mm clear")
+        if self.send(_MM_CLEAR, "mm clear"): self._mm_last = _MM_CLEAR
 
 class App(tk.Tk):
     def __init__(self):
@@ -153,7 +447,13 @@ class App(tk.Tk):
         self._init_style()
         self.dark_mode = False
 
+        # log lines are queued and flushed to the Text widget in batches
+        self._log_queue = collections.deque(maxlen=2000)
+        self.after(200, self._flush_log)
         self.vfd = VFD(self.log)
+        self._ports_cache = None   # (monotonic time, (device, ...))
+        self._ports_busy = False
+        self._ports_shown = None   # device tuple currently in the combobox
 
         # loops from v7
         self.loop_clock_text = False
@@ -185,6 +485,8 @@ class App(tk.Tk):
         self.loop_snake_game    = False
 
         # fps → ms (existing)
+        self.ms_clock_text  = 1000
+        self.ms_clock_sync  = 60_000
         self.ms_vol_sweep   = 120
         self.ms_wifi_scan   = 160
         self.ms_icon_wave   = 140
@@ -211,29 +513,61 @@ class App(tk.Tk):
         self.ms_clock_bars  = 500
         self.ms_snake_game  = 140  # game tick
 
+        # system meter sampler (see _sampler_loop)
+        self._levels = {"net": 0, "disk": 0, "mem": 0}
+        self._sampler_lock = threading.Lock()
+        self._meter_resets = set()   # meters (re)started/stopped since the sampler's last pass
+        self._sampler_thread = None
+
         # state for some modes
-        self._bounce_dir = +1
-        self._bounce_pos = 0
-        self._snake_path = [(r,c) for r in range(7) for c in (range(9) if r%2==0 else reversed(range(9)))]
+        self._marquee_frames = None   # encoded 16-char windows, rebuilt on text/line change
+        self._marquee_last = None     # last frame sent, repeats are skipped
+        self._bounce_frames  = None
+        self._bounce_i = 0
         self._snake_len  = 10
         self._snake_idx  = 0
-        self._rain_drops = []
+        self._rain_board = 0
         self._rain_p = 0.35
 
         # v8 states
         self._ball_pos = [3,4]  # r,c
         self._ball_vel = [1,1]
-        self._stick_col = -3
+        self._stick_pos = 0
         self._stick_frames = self._build_stickman_frames()
+        self._stick_stream = self._build_stickman_stream(self._stick_frames)
         self._gol_grid = self._rand_grid()
         # Snake game state
-        self._g_snake = [(3,2),(3,1),(3,0)]   # list of (r,c), head first
+        self._g_snake = collections.deque([(3,2),(3,1),(3,0)])   # (r,c), head first
+        self._g_snake_cells = set(self._g_snake)                 # same cells, for O(1) lookups
         self._g_dir = (0,1)                   # dr,dc
         self._g_pending = (0,1)
-        self._g_food = self._rand_food(self._g_snake)
+        self._g_food = self._rand_food(self._g_snake_cells)
         self._g_score = 0
         self._g_paused = False
 
+        # Animation loops, all driven by one _master_tick timer.
+        # name -> tick; loop_<name> switches it on/off, ms_<name> is its period.
+        self._loops = {
+            "clock_text": self._clock_text_tick,     "clock_sync": self._clock_sync_tick,
+            "vol_sweep": self._vol_sweep_tick,       "wifi_scan": self._wifi_scan_tick,
+            "icon_wave": self._icon_wave_tick,       "marquee": self._marquee_tick,
+            "cylon": self._cylon_tick,               "spin": self._spin_tick,
+            "twinkle": self._twinkle_tick,           "icon_carousel": self._icon_carousel_tick,
+            "icon_pulse": self._icon_pulse_tick,     "email_blink": self._email_blink_tick,
+            "record_blink": self._record_blink_tick, "text_bounce": self._text_bounce_tick,
+            "mini_rain": self._rain_tick,            "mini_snake": self._snake_tick,
+            "ball": self._ball_tick,                 "stickman": self._stickman_tick,
+            "gol": self._gol_tick,                   "clock_bars": self._clock_bars_tick,
+            "snake_game": self._snake_game_tick,
+            "net_meter": self._net_meter_tick,       "disk_meter": self._disk_meter_tick,
+            "mem_meter": self._mem_meter_tick,
+        }
+        # attribute names per loop, built once instead of concatenated every pass
+        self._loop_attrs = {name: ("loop_" + name, "ms_" + name) for name in self._loops}
+        self._loop_due = {}       # running loops only: name -> time (ms) of its next tick
+        self._master_id = None    # pending _master_tick timer, None while idle
+        self._master_at = 0       # monotonic ms that timer fires at
+
         # Global key binds for snake controls
         self.bind_all("<Left>",  lambda e:self._snake_key(-0, -1))
         self.bind_all("<Right>", lambda e:self._snake_key(0, 1))
@@ -248,12 +582,19 @@ class App(tk.Tk):
         self._build_brightness(self.body)
         self._build_icons(self.body)
         self._build_multimedia(self.body)
-        self._build_macros(self.body)
-        self._build_more_macros(self.body)
-        self._build_meters(self.body)
-        self._build_games(self.body)         # NEW: Snake + new MM modes
-        self._build_custom(self.body)
-        self._build_log(self.body)
+        # sections below the first screen are built one per idle round once
+        # the window is up, so it maps without waiting for ~300 widgets
+        self._deferred = collections.deque([
+            self._build_macros, self._build_more_macros, self._build_meters,
+            self._build_games,                # NEW: Snake + new MM modes
+            self._build_custom, self._build_log,
+        ])
+        self.after_idle(self._build_next_section)
+
+    def _build_next_section(self):
+        self._deferred.popleft()(self.body)
+        if self._deferred: self.after_idle(self._build_next_section)
+        elif self.dark_mode: self._apply_palette(self.palette_dark)   # colour the late log box
 
     # ---------- Theme ----------
     def _init_style(self):
@@ -278,6 +619,8 @@ class App(tk.Tk):
             self.logbox.configure(bg=pal["textbg"], fg=pal["textfg"], insertbackground=pal["textfg"])
         if hasattr(self, "canvas"):
             self.canvas.configure(bg=pal["bg"])
+        if hasattr(self, "mm_canvas"):
+            self.mm_canvas.configure(bg=pal["bg"])
 
     def _toggle_theme(self):
         self.dark_mode = not self.dark_mode
@@ -298,9 +641,20 @@ class App(tk.Tk):
             self.canvas.itemconfig(self.body_id, width=self.canvas.winfo_width())
         self.body.bind("<Configure>", _on_body_config)
         self.canvas.bind("<Configure>", lambda e: self.canvas.itemconfig(self.body_id, width=e.width))
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
+        # wheel bindings are global only while the pointer is over the scroll area
+        self.canvas.bind("<Enter>", self._wheel_bind)
+        self.canvas.bind("<Leave>", self._wheel_unbind)
+
+    def _wheel_bind(self, _=None):
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind_all(seq, self._on_mousewheel)
+
+    def _wheel_unbind(self, e):
+        # moving onto a child of the canvas also sends <Leave>; keep the binding then
+        x, y = e.x_root - self.canvas.winfo_rootx(), e.y_root - self.canvas.winfo_rooty()
+        if 0 <= x < self.canvas.winfo_width() and 0 <= y < self.canvas.winfo_height(): return
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.unbind_all(seq)
 
     def _on_mousewheel(self, event):
         if event.num == 4:   self.canvas.yview_scroll(-2, "units")
@@ -364,7 +718,13 @@ class App(tk.Tk):
         self.clock_line = ttk.Combobox(ft, state="readonly", width=6, values=["0","1"]); self.clock_line.set("0")
         self.clock_line.pack(side="left", padx=4)
         ttk.Label(ft, text="Format:").pack(side="left", padx=(12,4))
-        self.clock_fmt = tk.Entry(ft, width=26); self.clock_fmt.insert(0, "%H:%M:%S  %d.%m.%Y")
+        # the tick reads plain attributes kept in sync by the widgets, not the widgets
+        self._clock_line_n, self._clock_fmt = 0, "%H:%M:%S  %d.%m.%Y"
+        self.clock_line.bind("<<ComboboxSelected>>",
+                             lambda e: setattr(self, "_clock_line_n", int(self.clock_line.get() != "0")))
+        self.clock_fmt_var = tk.StringVar(value=self._clock_fmt)
+        self.clock_fmt_var.trace_add("write", lambda *_: setattr(self, "_clock_fmt", self.clock_fmt_var.get()))
+        self.clock_fmt = tk.Entry(ft, width=26, textvariable=self.clock_fmt_var)
         self.clock_fmt.pack(side="left", padx=4)
         ttk.Button(ft, text="Start", command=self._clock_text_start).pack(side="left", padx=8)
         ttk.Button(ft, text="Stop",  command=self._clock_text_stop).pack(side="left", padx=4)
@@ -378,9 +738,15 @@ class App(tk.Tk):
         f = ttk.LabelFrame(parent, text="Brightness")
         f.pack(fill="x", padx=8, pady=6)
         ttk.Label(f, text="Global (0..5)").pack(side="left", padx=(8,4))
-        self.bright = tk.Scale(f, from_=0, to=5, orient="horizontal", length=220,
-                               command=lambda v:self.vfd.set_brightness(int(float(v))))
+        self.bright = tk.Scale(f, from_=0, to=5, orient="horizontal", length=220)
         self.bright.set(3); self.bright.pack(side="left", padx=6)
+        self._on_release(self.bright, self.vfd.set_brightness)
+
+    def _on_release(self, scale, fn):
+        # send only once the slider is let go (or a key moved it), not on every drag step
+        cb = lambda e: fn(int(scale.get()))
+        scale.bind("<ButtonRelease-1>", cb)
+        scale.bind("<KeyRelease>", cb)
 
     def _build_icons(self, parent):
         f = ttk.LabelFrame(parent, text="Icons & Indicators (ESC 30 xx yy)")
@@ -390,48 +756,48 @@ class App(tk.Tk):
                           ("Movie",0x04),("TV",0x05),("Music",0x06),("Photo",0x07)]:
             col = ttk.Frame(top); col.pack(side="left", padx=6)
             ttk.Label(col, text=name).pack()
-            s = tk.Scale(col, from_=0, to=6, orient="vertical", length=120,
-                         command=lambda v, sub=sub: self.vfd.icon_brightness(sub, int(float(v))))
+            s = tk.Scale(col, from_=0, to=6, orient="vertical", length=120)
             s.set(0); s.pack()
+            self._on_release(s, lambda v, sub=sub: self.vfd.icon_brightness(sub, v, force=True))
 
         mid = ttk.Frame(f); mid.pack(fill="x", pady=6)
         recf = ttk.LabelFrame(mid, text="Recording (0x08)")
         recf.pack(side="left", padx=6)
         self.var_rec = tk.BooleanVar()
         tk.Checkbutton(recf, text="On", variable=self.var_rec,
-                       command=lambda:self.vfd.set_record(self.var_rec.get())).pack(padx=6, pady=4)
+                       command=lambda:self.vfd.set_record(self.var_rec.get(), force=True)).pack(padx=6, pady=4)
 
         em = ttk.LabelFrame(mid, text="Email (0x09 white, 0x0A red)")
         em.pack(side="left", padx=6)
         self.email_mode = tk.IntVar(value=0)
         ttk.Radiobutton(em, text="Off",   variable=self.email_mode, value=0,
-                        command=lambda:(self.vfd.set_email_white(False),
-                                        self.vfd.set_email_red(False))).pack(anchor="w")
+                        command=lambda:(self.vfd.set_email_white(False, force=True),
+                                        self.vfd.set_email_red(False, force=True))).pack(anchor="w")
         ttk.Radiobutton(em, text="White", variable=self.email_mode, value=1,
-                        command=lambda:(self.vfd.set_email_white(True),
-                                        self.vfd.set_email_red(False))).pack(anchor="w")
+                        command=lambda:(self.vfd.set_email_white(True, force=True),
+                                        self.vfd.set_email_red(False, force=True))).pack(anchor="w")
         ttk.Radiobutton(em, text="White+Red", variable=self.email_mode, value=2,
-                        command=lambda:(self.vfd.set_email_white(True),
-                                        self.vfd.set_email_red(True))).pack(anchor="w")
+                        command=lambda:(self.vfd.set_email_white(True, force=True),
+                                        self.vfd.set_email_red(True, force=True))).pack(anchor="w")
 
         sp = ttk.LabelFrame(mid, text="Speaker (0x13 speaker / 0x14 muted)")
         sp.pack(side="left", padx=6)
         self.sp_mode = tk.IntVar(value=0)
         for label, val in [("Off",0),("Muted",1),("Speaker",2)]:
             ttk.Radiobutton(sp, text=label, variable=self.sp_mode, value=val,
-                            command=lambda:self.vfd.set_speaker_mode(self.sp_mode.get())).pack(anchor="w")
+                            command=lambda:self.vfd.set_speaker_mode(self.sp_mode.get(), force=True)).pack(anchor="w")
 
         vol = ttk.LabelFrame(mid, text="Volume 0..8 (bars 0x0B..0x11, red 0x12)")
         vol.pack(side="left", padx=6)
-        self.vol_scale = tk.Scale(vol, from_=0, to=8, orient="horizontal", length=220,
-                                  command=lambda v:self.vfd.set_volume_level(int(float(v))))
+        self.vol_scale = tk.Scale(vol, from_=0, to=8, orient="horizontal", length=220)
         self.vol_scale.set(0); self.vol_scale.pack(padx=6, pady=6)
+        self._on_release(self.vol_scale, lambda v: self.vfd.set_volume_level(v, force=True))
 
         wf = ttk.LabelFrame(mid, text="Red bars 0..3 (0x15..0x17)")
         wf.pack(side="left", padx=6)
-        self.wifi_scale = tk.Scale(wf, from_=0, to=3, orient="horizontal", length=160,
-                                   command=lambda v:self.vfd.set_wifi_level(int(float(v))))
+        self.wifi_scale = tk.Scale(wf, from_=0, to=3, orient="horizontal", length=160)
         self.wifi_scale.set(0); self.wifi_scale.pack(padx=6, pady=6)
+        self._on_release(self.wifi_scale, lambda v: self.vfd.set_wifi_level(v, force=True))
 
         bx = ttk.LabelFrame(f, text="Bounding boxes (0x18..0x1C)")
         bx.pack(fill="x", padx=4, pady=6)
@@ -439,18 +805,20 @@ class App(tk.Tk):
         names = ["HDD..USB (0x18)", "Movie..Photo (0x19)", "Rec/MM (0x1A)", "Email (0x1B)", "Volume (0x1C)"]
         for i, nm in enumerate(names):
             tk.Checkbutton(bx, text=nm, variable=self.box_vars[i],
-                           command=lambda i=i: self.vfd.set_box(i, self.box_vars[i].get())
+                           command=lambda i=i: self.vfd.set_box(i, self.box_vars[i].get(), force=True)
                            ).pack(side="left", padx=6)
 
     def _build_multimedia(self, parent):
         f = ttk.LabelFrame(parent, text="Mini-matrix 9×7 (ESC 31 + 9 cols)")
         f.pack(fill="x", padx=8, pady=6)
-        self.mm_cells = [[tk.IntVar(value=0) for _ in range(9)] for __ in range(7)]
-        grid = ttk.Frame(f); grid.pack(side="left", padx=8, pady=4)
-        for r in range(7):
-            rowf = ttk.Frame(grid); rowf.pack()
-            for c in range(9):
-                tk.Checkbutton(rowf, width=2, variable=self.mm_cells[r][c]).pack(side="left")
+        # editor state kept in wire format: one byte per column, bit r = row r
+        self.mm_cols = [0]*9
+        self.mm_canvas = tk.Canvas(f, width=9*MM_CELL, height=7*MM_CELL, highlightthickness=0, bg=self.cget("bg"))
+        self.mm_canvas.pack(side="left", padx=8, pady=4)
+        self.mm_rects = [[self.mm_canvas.create_rectangle(c*MM_CELL+1, r*MM_CELL+1, (c+1)*MM_CELL-1, (r+1)*MM_CELL-1,
+                                                          fill=MM_OFF, outline="")
+                          for c in range(9)] for r in range(7)]
+        self.mm_canvas.bind("<Button-1>", self._mm_toggle_cell)
         btns = ttk.Frame(f); btns.pack(side="left", padx=12)
         ttk.Button(btns, text="Send frame", command=self._send_mm_from_grid).pack(fill="x", pady=3)
         ttk.Button(btns, text="Clear", command=self.vfd.mm_clear).pack(fill="x", pady=3)
@@ -466,7 +834,7 @@ class App(tk.Tk):
         self.mm_choice = ttk.Combobox(btns, state="readonly", width=14, values=list(self.mm_presets.keys()))
         self.mm_choice.set("Play ▶"); self.mm_choice.pack(fill="x", pady=3)
         ttk.Button(btns, text="Send preset",
-                   command=lambda:self.vfd.mm_send_cols(self.mm_presets[self.mm_choice.get()])
+                   command=lambda:self.vfd.mm_send_cols(self.mm_presets[self.mm_choice.get()], force=True)
                    ).pack(fill="x", pady=3)
 
     # (Existing macros/more macros/meters from v7) ----
@@ -477,130 +845,109 @@ class App(tk.Tk):
     def _build_macros(self, parent):
         f = ttk.LabelFrame(parent, text="Macros / Fun modes (set FPS for each)")
         f.pack(fill="x", padx=8, pady=6)
-        def fps_spin(parent, initial, cb):
-            wrap = ttk.Frame(parent); wrap.pack(padx=6)
-            ttk.Label(wrap, text="FPS:").pack(side="left")
-            sp = tk.Spinbox(wrap, from_=1, to=60, width=4, command=lambda:cb(int(sp.get())))
-            sp.delete(0, "end"); sp.insert(0, str(initial))
-            sp.pack(side="left", padx=4)
-            return sp
         vs = ttk.LabelFrame(f, text="Volume sweep"); vs.pack(side="left", padx=8, pady=4)
         ttk.Button(vs, text="Start", command=self._vol_sweep_start).pack(fill="x", pady=2)
         ttk.Button(vs, text="Stop",  command=self._vol_sweep_stop).pack(fill="x")
-        fps_spin(vs, round(1000/self.ms_vol_sweep), self._set_vol_sweep_fps)
+        self._fps_spin(vs, "ms_vol_sweep", padx=6)
 
         ws = ttk.LabelFrame(f, text="Wi-Fi scan"); ws.pack(side="left", padx=8, pady=4)
         ttk.Button(ws, text="Start", command=self._wifi_scan_start).pack(fill="x", pady=2)
         ttk.Button(ws, text="Stop",  command=self._wifi_scan_stop).pack(fill="x")
-        fps_spin(ws, round(1000/self.ms_wifi_scan), self._set_wifi_scan_fps)
+        self._fps_spin(ws, "ms_wifi_scan", padx=6)
 
         iw = ttk.LabelFrame(f, text="Icon brightness wave"); iw.pack(side="left", padx=8, pady=4)
         ttk.Button(iw, text="Start", command=self._icon_wave_start).pack(fill="x", pady=2)
         ttk.Button(iw, text="Stop",  command=self._icon_wave_stop).pack(fill="x")
-        fps_spin(iw, round(1000/self.ms_icon_wave), self._set_icon_wave_fps)
+        self._fps_spin(iw, "ms_icon_wave", padx=6)
 
         mq = ttk.LabelFrame(f, text="Marquee text"); mq.pack(fill="x", padx=8, pady=6)
         row = ttk.Frame(mq); row.pack(fill="x", pady=2)
         ttk.Label(row, text="Line:").pack(side="left", padx=(6,4))
         self.marquee_line = ttk.Combobox(row, state="readonly", width=6, values=["0","1"]); self.marquee_line.set("0")
         self.marquee_line.pack(side="left")
+        self.marquee_line.bind("<<ComboboxSelected>>", lambda e: setattr(self, "_marquee_frames", None))
         ttk.Label(row, text="Text:").pack(side="left", padx=(10,4))
-        self.marquee_text = tk.Entry(row, width=40); self.marquee_text.insert(0, "Hello from MD8800   ")
+        self.marquee_var = tk.StringVar(value="Hello from MD8800   ")
+        self.marquee_var.trace_add("write", lambda *_: setattr(self, "_marquee_frames", None))
+        self.marquee_text = tk.Entry(row, width=40, textvariable=self.marquee_var)
         self.marquee_text.pack(side="left")
         btns = ttk.Frame(mq); btns.pack(fill="x")
         ttk.Button(btns, text="Start", command=self._marquee_start).pack(side="left", padx=6)
         ttk.Button(btns, text="Stop",  command=self._marquee_stop).pack(side="left")
-        fps_spin(btns, round(1000/self.ms_marquee), self._set_marquee_fps)
+        self._fps_spin(btns, "ms_marquee", padx=6)
 
         cy = ttk.LabelFrame(f, text="Cylon (volume ping-pong)"); cy.pack(side="left", padx=8, pady=6)
         ttk.Button(cy, text="Start", command=self._cylon_start).pack(fill="x", pady=2)
         ttk.Button(cy, text="Stop",  command=self._cylon_stop).pack(fill="x")
-        fps_spin(cy, round(1000/self.ms_cylon), self._set_cylon_fps)
+        self._fps_spin(cy, "ms_cylon", padx=6)
 
         mm = ttk.LabelFrame(f, text="Mini-matrix animations"); mm.pack(side="left", padx=8, pady=6)
         ttk.Button(mm, text="Spinner Start", command=self._spin_start).pack(fill="x", pady=2)
         ttk.Button(mm, text="Spinner Stop",  command=self._spin_stop).pack(fill="x")
-        wrap = ttk.Frame(mm); wrap.pack()
-        sp = tk.Spinbox(wrap, from_=1, to=60, width=4, command=lambda:self._set_spin_fps(int(sp.get())))
-        tk.Label(wrap, text="FPS:").pack(side="left"); sp.delete(0,"end"); sp.insert(0, round(1000/self.ms_spin)); sp.pack(side="left", padx=4)
+        self._fps_spin(mm, "ms_spin")
         ttk.Separator(mm, orient="horizontal").pack(fill="x", pady=4)
         ttk.Button(mm, text="Twinkle Start", command=self._twinkle_start).pack(fill="x", pady=2)
         ttk.Button(mm, text="Twinkle Stop",  command=self._twinkle_stop).pack(fill="x")
-        wrap2 = ttk.Frame(mm); wrap2.pack()
-        sp2 = tk.Spinbox(wrap2, from_=1, to=60, width=4, command=lambda:self._set_twinkle_fps(int(sp2.get())))
-        tk.Label(wrap2, text="FPS:").pack(side="left"); sp2.delete(0,"end"); sp2.insert(0, round(1000/self.ms_twinkle)); sp2.pack(side="left", padx=4)
+        self._fps_spin(mm, "ms_twinkle")
 
     def _build_more_macros(self, parent):
         f = ttk.LabelFrame(parent, text="More Macros / Fun modes")
         f.pack(fill="x", padx=8, pady=6)
-        def fps_spin(parent, initial, cb):
-            wrap = ttk.Frame(parent); wrap.pack(padx=6)
-            ttk.Label(wrap, text="FPS:").pack(side="left")
-            sp = tk.Spinbox(wrap, from_=1, to=60, width=4, command=lambda:cb(int(sp.get())))
-            sp.delete(0, "end"); sp.insert(0, str(initial))
-            sp.pack(side="left", padx=4)
-            return sp
-
         ic = ttk.LabelFrame(f, text="Icon Carousel"); ic.pack(side="left", padx=8, pady=6)
         ttk.Button(ic, text="Start", command=self._icon_carousel_start).pack(fill="x", pady=2)
         ttk.Button(ic, text="Stop",  command=self._icon_carousel_stop).pack(fill="x")
-        fps_spin(ic, round(1000/self.ms_icon_carousel), self._set_icon_carousel_fps)
+        self._fps_spin(ic, "ms_icon_carousel", padx=6)
 
         ip = ttk.LabelFrame(f, text="Icon Pulse (phased)"); ip.pack(side="left", padx=8, pady=6)
         ttk.Button(ip, text="Start", command=self._icon_pulse_start).pack(fill="x", pady=2)
         ttk.Button(ip, text="Stop",  command=self._icon_pulse_stop).pack(fill="x")
-        fps_spin(ip, round(1000/self.ms_icon_pulse), self._set_icon_pulse_fps)
+        self._fps_spin(ip, "ms_icon_pulse", padx=6)
 
         eb = ttk.LabelFrame(f, text="Email Blink"); eb.pack(side="left", padx=8, pady=6)
         ttk.Button(eb, text="Start", command=self._email_blink_start).pack(fill="x", pady=2)
         ttk.Button(eb, text="Stop",  command=self._email_blink_stop).pack(fill="x")
-        fps_spin(eb, round(1000/self.ms_email_blink), self._set_email_blink_fps)
+        self._fps_spin(eb, "ms_email_blink", padx=6)
 
         rb = ttk.LabelFrame(f, text="Record Blink"); rb.pack(side="left", padx=8, pady=6)
         ttk.Button(rb, text="Start", command=self._record_blink_start).pack(fill="x", pady=2)
         ttk.Button(rb, text="Stop",  command=self._record_blink_stop).pack(fill="x")
-        fps_spin(rb, round(1000/self.ms_record_blink), self._set_record_blink_fps)
+        self._fps_spin(rb, "ms_record_blink", padx=6)
 
         tb = ttk.LabelFrame(f, text="Text Bounce"); tb.pack(fill="x", padx=8, pady=6)
         row = ttk.Frame(tb); row.pack(fill="x", pady=2)
         ttk.Label(row, text="Line:").pack(side="left", padx=(6,4))
         self.bounce_line = ttk.Combobox(row, state="readonly", width=6, values=["0","1"]); self.bounce_line.set("1")
         self.bounce_line.pack(side="left")
+        self.bounce_line.bind("<<ComboboxSelected>>", lambda e: setattr(self, "_bounce_frames", None))
         ttk.Label(row, text="Text:").pack(side="left", padx=(10,4))
-        self.bounce_text = tk.Entry(row, width=40); self.bounce_text.insert(0, "Bouncing!")
+        self.bounce_var = tk.StringVar(value="Bouncing!")
+        self.bounce_var.trace_add("write", lambda *_: setattr(self, "_bounce_frames", None))
+        self.bounce_text = tk.Entry(row, width=40, textvariable=self.bounce_var)
         self.bounce_text.pack(side="left")
         btns = ttk.Frame(tb); btns.pack(fill="x")
         ttk.Button(btns, text="Start", command=self._text_bounce_start).pack(side="left", padx=6)
         ttk.Button(btns, text="Stop",  command=self._text_bounce_stop).pack(side="left")
-        fps_spin(btns, round(1000/self.ms_text_bounce), self._set_text_bounce_fps)
+        self._fps_spin(btns, "ms_text_bounce", padx=6)
 
         rn = ttk.LabelFrame(f, text="Mini-matrix Rain"); rn.pack(side="left", padx=8, pady=6)
         ttk.Button(rn, text="Start", command=self._rain_start).pack(fill="x", pady=2)
         ttk.Button(rn, text="Stop",  command=self._rain_stop).pack(fill="x")
-        fps_spin(rn, round(1000/self.ms_mini_rain), self._set_mini_rain_fps)
+        self._fps_spin(rn, "ms_mini_rain", padx=6)
 
         sn = ttk.LabelFrame(f, text="Mini-matrix Snake (path)"); sn.pack(side="left", padx=8, pady=6)
         ttk.Button(sn, text="Start", command=self._snake_start).pack(fill="x", pady=2)
         ttk.Button(sn, text="Stop",  command=self._snake_stop).pack(fill="x")
-        fps_spin(sn, round(1000/self.ms_mini_snake), self._set_mini_snake_fps)
+        self._fps_spin(sn, "ms_mini_snake", padx=6)
 
     def _build_meters(self, parent):
         f = ttk.LabelFrame(parent, text="System meters (psutil optional)")
         f.pack(fill="x", padx=8, pady=6)
-        def fps_spin(parent, initial, cb):
-            wrap = ttk.Frame(parent); wrap.pack(padx=6)
-            ttk.Label(wrap, text="FPS:").pack(side="left")
-            sp = tk.Spinbox(wrap, from_=1, to=60, width=4, command=lambda:cb(int(sp.get())))
-            sp.delete(0, "end"); sp.insert(0, str(initial))
-            sp.pack(side="left", padx=4)
-            return sp
-
         nm = ttk.LabelFrame(f, text="Net meter → red bars (0..3)")
         nm.pack(side="left", padx=8, pady=6)
         if HAVE_PSUTIL:
             ttk.Button(nm, text="Start", command=self._net_meter_start).pack(fill="x", pady=2)
             ttk.Button(nm, text="Stop",  command=self._net_meter_stop).pack(fill="x")
-            fps_spin(nm, round(1000/self.ms_net_meter), self._set_net_meter_fps)
+            self._fps_spin(nm, "ms_net_meter", padx=6)
         else:
             ttk.Label(nm, text="Install psutil: pip install psutil").pack(padx=6, pady=10)
 
@@ -609,7 +956,7 @@ class App(tk.Tk):
         if HAVE_PSUTIL:
             ttk.Button(dm, text="Start", command=self._disk_meter_start).pack(fill="x", pady=2)
             ttk.Button(dm, text="Stop",  command=self._disk_meter_stop).pack(fill="x")
-            fps_spin(dm, round(1000/self.ms_disk_meter), self._set_disk_meter_fps)
+            self._fps_spin(dm, "ms_disk_meter", padx=6)
         else:
             ttk.Label(dm, text="Install psutil").pack(padx=6, pady=10)
 
@@ -618,7 +965,7 @@ class App(tk.Tk):
         if HAVE_PSUTIL:
             ttk.Button(mm, text="Start", command=self._mem_meter_start).pack(fill="x", pady=2)
             ttk.Button(mm, text="Stop",  command=self._mem_meter_stop).pack(fill="x")
-            fps_spin(mm, round(1000/self.ms_mem_meter), self._set_mem_meter_fps)
+            self._fps_spin(mm, "ms_mem_meter", padx=6)
         else:
             ttk.Label(mm, text="Install psutil").pack(padx=6, pady=10)
 
@@ -637,11 +984,7 @@ class App(tk.Tk):
         ttk.Button(btnrow, text="Reset", command=self._snake_game_reset).pack(side="left", padx=4)
 
         # FPS spinner for snake
-        row = ttk.Frame(sg); row.pack(pady=4)
-        ttk.Label(row, text="FPS:").pack(side="left")
-        self.snake_fps_spin = tk.Spinbox(row, from_=1, to=60, width=4, command=lambda:self._set_snake_game_fps(int(self.snake_fps_spin.get())))
-        self.snake_fps_spin.delete(0,'end'); self.snake_fps_spin.insert(0, round(1000/self.ms_snake_game))
-        self.snake_fps_spin.pack(side="left", padx=4)
+        self.snake_fps_spin = self._fps_spin(sg, "ms_snake_game", pady=4)
 
         # On-screen D-pad
         pad = ttk.Frame(sg); pad.pack(pady=6)
@@ -660,38 +1003,73 @@ class App(tk.Tk):
         bb = ttk.Frame(ex); bb.pack(fill="x", pady=2)
         ttk.Button(bb, text="Bouncy Ball Start", command=self._ball_start).pack(side="left")
         ttk.Button(bb, text="Stop", command=self._ball_stop).pack(side="left", padx=6)
-        self._mk_fps_spin(ex, "Ball FPS:", self.ms_ball, self._set_ball_fps)
+        self._fps_spin(ex, "ms_ball", "Ball FPS:", pady=2)
 
         # Stickman run
         st = ttk.Frame(ex); st.pack(fill="x", pady=2)
         ttk.Button(st, text="Stickman Run Start", command=self._stickman_start).pack(side="left")
         ttk.Button(st, text="Stop", command=self._stickman_stop).pack(side="left", padx=6)
-        self._mk_fps_spin(ex, "Stickman FPS:", self.ms_stickman, self._set_stickman_fps)
+        self._fps_spin(ex, "ms_stickman", "Stickman FPS:", pady=2)
 
         # Game of Life
         gl = ttk.Frame(ex); gl.pack(fill="x", pady=2)
         ttk.Button(gl, text="Game of Life Start", command=self._gol_start).pack(side="left")
         ttk.Button(gl, text="Stop", command=self._gol_stop).pack(side="left", padx=6)
         ttk.Button(gl, text="Randomize", command=lambda:self._gol_randomize()).pack(side="left", padx=6)
-        self._mk_fps_spin(ex, "GoL FPS:", self.ms_gol, self._set_gol_fps)
+        self._fps_spin(ex, "ms_gol", "GoL FPS:", pady=2)
 
         # Clock bars
         cb = ttk.Frame(ex); cb.pack(fill="x", pady=2)
         ttk.Button(cb, text="Clock Bars Start", command=self._clock_bars_start).pack(side="left")
         ttk.Button(cb, text="Stop", command=self._clock_bars_stop).pack(side="left", padx=6)
-        self._mk_fps_spin(ex, "Clock Bars FPS:", self.ms_clock_bars, self._set_clock_bars_fps)
+        self._fps_spin(ex, "ms_clock_bars", "Clock Bars FPS:", pady=2)
 
-    def _mk_fps_spin(self, parent, label, ms_val, setter):
-        wrap = ttk.Frame(parent); wrap.pack(pady=2)
+    def _fps_spin(self, parent, attr, label="FPS:", **pack):
+        # 1..60 FPS spinbox bound to the loop period self.<attr> (ms)
+        wrap = ttk.Frame(parent); wrap.pack(**pack)
         ttk.Label(wrap, text=label).pack(side="left")
-        sp = tk.Spinbox(wrap, from_=1, to=60, width=4, command=lambda:setter(int(sp.get())))
-        sp.delete(0,"end"); sp.insert(0, round(1000/ms_val)); sp.pack(side="left", padx=4)
+        var = tk.IntVar(value=self._ms_to_fps(getattr(self, attr)))
+        sp = tk.Spinbox(wrap, from_=1, to=60, width=4, textvariable=var)
+        sp.pack(side="left", padx=4)
+        self._bind_fps(var, attr)
+        return sp
+
+    def _bind_fps(self, var, attr):
+        # arrows and typed values both land here; ignore half-typed input
+        def apply(*_):
+            try: setattr(self, attr, self._fps_to_ms(var.get()))
+            except tk.TclError: pass
+        var.trace_add("write", apply)
 
     # ---------- Helpers ----------
     def _refresh_ports(self):
-        ports = [p.device for p in serial.tools.list_ports.comports()]
+        # comports() can block for a few hundred ms (sysfs / SetupAPI), so it
+        # runs on a worker thread; results younger than 2 s are reused
+        cached = self._ports_cache
+        if cached and time.monotonic() - cached[0] < 2.0:
+            self._set_ports(cached[1]); return
+        if self._ports_busy: return
+        self._ports_busy = True
+        threading.Thread(target=self._enum_ports_bg, daemon=True).start()
+        self.after(50, self._poll_ports)
+
+    def _enum_ports_bg(self):
+        try: ports = tuple(p.device for p in serial.tools.list_ports.comports())
+        except Exception: ports = ()
+        self._ports_cache = (time.monotonic(), ports)
+        self._ports_busy = False
+
+    def _poll_ports(self):
+        # Tk is only touched from the main thread
+        if self._ports_busy: self.after(50, self._poll_ports); return
+        self._set_ports(self._ports_cache[1])
+
+    def _set_ports(self, ports):
+        # leave the combobox (and the user's pick) alone if nothing changed
+        if ports == self._ports_shown: return
+        self._ports_shown = ports
         self.cmb["values"] = ports
-        if ports: self.cmb.set(ports[0])
+        if ports and self.cmb.get() not in ports: self.cmb.set(ports[0])
 
     def _connect(self):
         port = self.cmb.get().strip()
@@ -708,377 +1086,337 @@ class App(tk.Tk):
         except:
             messagebox.showerror("ESC", "Bad ESC code hex"); return
         params = parse_hex(self.e_params.get())
+        self.vfd.invalidate_caches()   # may change device state behind the caches' back
         self.vfd.ESC(code, *list(params))
 
     def _send_raw(self):
-        data = parse_hex(self.e_raw.get()); self.vfd.send(data, "RAW")
+        data = parse_hex(self.e_raw.get())
+        self.vfd.invalidate_caches()
+        self.vfd.send(data, "RAW")
+
+    def _mm_toggle_cell(self, event):
+        r, c = event.y // MM_CELL, event.x // MM_CELL
+        if not (0 <= r < 7 and 0 <= c < 9): return
+        self.mm_cols[c] ^= (1 << r)
+        on = self.mm_cols[c] >> r & 1
+        self.mm_canvas.itemconfig(self.mm_rects[r][c], fill=MM_ON if on else MM_OFF)
 
     def _send_mm_from_grid(self):
-        cols = []
-        for c in range(9):
-            v = 0
-            for r in range(7):
-                if self.mm_cells[r][c].get():
-                    v |= (1 << r)
-            cols.append(v & 0x7F)
-        self.vfd.mm_send_cols(cols)
+        self.vfd.mm_send_cols(self.mm_cols, force=True)
 
     # ---------- FPS utils ----------
-    def _fps_to_ms(self, fps): return max(10, int(1000 / max(1, min(60, fps))))
-    # existing setters
-    def _set_vol_sweep_fps(self, fps):   self.ms_vol_sweep   = self._fps_to_ms(fps)
-    def _set_wifi_scan_fps(self, fps):   self.ms_wifi_scan   = self._fps_to_ms(fps)
-    def _set_icon_wave_fps(self, fps):   self.ms_icon_wave   = self._fps_to_ms(fps)
-    def _set_marquee_fps(self, fps):     self.ms_marquee     = self._fps_to_ms(fps)
-    def _set_cylon_fps(self, fps):       self.ms_cylon       = self._fps_to_ms(fps)
-    def _set_spin_fps(self, fps):        self.ms_spin        = self._fps_to_ms(fps)
-    def _set_twinkle_fps(self, fps):     self.ms_twinkle     = self._fps_to_ms(fps)
-    def _set_cpu_meter_fps(self, fps):   self.ms_cpu_meter   = self._fps_to_ms(fps)
-    def _set_icon_carousel_fps(self, fps): self.ms_icon_carousel = self._fps_to_ms(fps)
-    def _set_icon_pulse_fps(self, fps):    self.ms_icon_pulse    = self._fps_to_ms(fps)
-    def _set_email_blink_fps(self, fps):   self.ms_email_blink   = self._fps_to_ms(fps)
-    def _set_record_blink_fps(self, fps):  self.ms_record_blink  = self._fps_to_ms(fps)
-    def _set_text_bounce_fps(self, fps):   self.ms_text_bounce   = self._fps_to_ms(fps)
-    def _set_mini_rain_fps(self, fps):     self.ms_mini_rain     = self._fps_to_ms(fps)
-    def _set_mini_snake_fps(self, fps):    self.ms_mini_snake    = self._fps_to_ms(fps)
-    def _set_net_meter_fps(self, fps):     self.ms_net_meter     = self._fps_to_ms(fps)
-    def _set_disk_meter_fps(self, fps):    self.ms_disk_meter    = self._fps_to_ms(fps)
-    def _set_mem_meter_fps(self, fps):     self.ms_mem_meter     = self._fps_to_ms(fps)
-    # new setters
-    def _set_ball_fps(self, fps):          self.ms_ball          = self._fps_to_ms(fps)
-    def _set_stickman_fps(self, fps):      self.ms_stickman      = self._fps_to_ms(fps)
-    def _set_gol_fps(self, fps):           self.ms_gol           = self._fps_to_ms(fps)
-    def _set_clock_bars_fps(self, fps):    self.ms_clock_bars    = self._fps_to_ms(fps)
-    def _set_snake_game_fps(self, fps):    self.ms_snake_game    = self._fps_to_ms(fps)
+    def _fps_to_ms(self, fps): return _FPS_MS[max(1, min(60, int(fps)))]
+    def _ms_to_fps(self, ms):  return max(1, min(60, round(1000 / ms)))
+
+    # ---------- Animation scheduler ----------
+    def _loop_on(self, name):
+        # enable a loop and run its first frame right away
+        setattr(self, "loop_" + name, True)
+        t = self._loop_due[name] = int(time.monotonic() * 1000) + getattr(self, "ms_" + name)
+        if self._master_id is None or t < self._master_at:
+            self._master_arm(t)   # idle, or sleeping past this loop's first tick
+        self._loops[name]()
+
+    def _master_arm(self, at):
+        # (re)schedule the master tick for monotonic ms `at`, but never sooner
+        # than MASTER_MS from now: that is the scheduler's finest resolution
+        if self._master_id is not None: self.after_cancel(self._master_id)
+        now = int(time.monotonic() * 1000)
+        delay = max(MASTER_MS, at - now)
+        self._master_at = now + delay
+        self._master_id = self.after(delay, self._master_tick)
+
+    def _master_tick(self):
+        # Fixed timestep: each loop's next tick is due one period after the
+        # previous due time, not after "now", so periods don't drift by the
+        # timer latency. Loops whose flag was cleared (stop buttons,
+        # _stop_all_mm) are dropped here; with none left the timer goes idle,
+        # otherwise it sleeps until the earliest due loop (a lone 1 s clock
+        # wakes Tk once a second, not every MASTER_MS).
+        # All frames of one pass go out as a single write. Flags and periods
+        # are plain instance attributes, read straight from the instance dict
+        # (getattr would first search Tk's long class MRO for each one).
+        now = int(time.monotonic() * 1000)
+        due, attrs, loops, inst = self._loop_due, self._loop_attrs, self._loops, self.__dict__
+        with self.vfd.batched():
+            for name, t in list(due.items()):
+                flag, ms_attr = attrs[name]
+                if not inst[flag]:
+                    del due[name]; continue
+                if now < t: continue
+                ms = inst[ms_attr]
+                due[name] = t + ms if t + ms > now else now + ms   # fell behind: skip, don't burst
+                try: loops[name]()
+                except Exception as e:
+                    setattr(self, flag, False); due.pop(name, None)
+                    self.log(f"[error] {name}: {e}")
+        self._master_id = None
+        if due: self._master_arm(min(due.values()))
 
     # ---------- Existing fun modes (same logic as v7) ----------
     # (Implementations identical to v7; omitted comments for brevity)
     def _clock_text_start(self):
         if self.loop_clock_text: return
-        self.loop_clock_text = True; self._clock_text_tick()
+        self._loop_on("clock_text")
     def _clock_text_stop(self): self.loop_clock_text = False
     def _clock_text_tick(self):
-        if not self.loop_clock_text: return
-        line = 0 if self.clock_line.get() == "0" else 1
-        fmt = self.clock_fmt.get() or "%H:%M:%S"
+        fmt = self._clock_fmt or "%H:%M:%S"
         try: s = datetime.datetime.now().strftime(fmt)
         except: s = datetime.datetime.now().strftime("%H:%M:%S %d.%m.%Y")
-        (self.vfd.mode_line1() if line==0 else self.vfd.mode_line2())
-        self.vfd.pos1(); self.vfd.write_text(s[:16])
-        self.after(1000, self._clock_text_tick)
+        self.vfd.draw_text_line(self._clock_line_n, s)
 
     def _clock_sync_start(self):
         if self.loop_clock_sync: return
-        self.loop_clock_sync = True; self._clock_sync_tick()
+        self._loop_on("clock_sync")
     def _clock_sync_stop(self): self.loop_clock_sync = False
     def _clock_sync_tick(self):
-        if not self.loop_clock_sync: return
         self.vfd.clock_set(datetime.datetime.now())
-        self.after(60_000, self._clock_sync_tick)
 
     def _vol_sweep_start(self):
         if self.loop_vol_sweep: return
-        self.loop_vol_sweep = True; self._vol_sweep_tick(0, +1)
+        self._vol_lvl, self._vol_step = 0, +1; self._loop_on("vol_sweep")
     def _vol_sweep_stop(self): self.loop_vol_sweep = False
-    def _vol_sweep_tick(self, lvl, step):
-        if not self.loop_vol_sweep: return
-        self.vfd.set_volume_level(lvl)
-        nxt = lvl + step
+    def _vol_sweep_tick(self):
+        self.vfd.set_volume_level(self._vol_lvl)
+        nxt, step = self._vol_lvl + self._vol_step, self._vol_step
         if nxt > 8: nxt, step = 7, -1
         if nxt < 0: nxt, step = 1, +1
-        self.after(self.ms_vol_sweep, lambda:self._vol_sweep_tick(nxt, step))
+        self._vol_lvl, self._vol_step = nxt, step
 
     def _wifi_scan_start(self):
         if self.loop_wifi_scan: return
-        self.loop_wifi_scan = True; self._wifi_scan_tick(0)
+        self._wifi_state = 0; self._loop_on("wifi_scan")
     def _wifi_scan_stop(self):
         self.loop_wifi_scan = False; self.vfd.set_wifi_level(0)
-    def _wifi_scan_tick(self, state):
-        if not self.loop_wifi_scan: return
+    def _wifi_scan_tick(self):
         seq = [0,1,2,3,2,1]
-        self.vfd.set_wifi_level(seq[state % len(seq)])
-        self.after(self.ms_wifi_scan, lambda:self._wifi_scan_tick(state+1))
+        self.vfd.set_wifi_level(seq[self._wifi_state % len(seq)])
+        self._wifi_state += 1
 
     def _icon_wave_start(self):
         if self.loop_icon_wave: return
-        self.loop_icon_wave = True; self._icon_wave_tick(0, +1)
+        self._wave_lvl, self._wave_step = 0, +1; self._loop_on("icon_wave")
     def _icon_wave_stop(self):
         self.loop_icon_wave = False
-        for sub in range(0x00, 0x08): self.vfd.icon_brightness(sub, 0)
-    def _icon_wave_tick(self, lvl, step):
-        if not self.loop_icon_wave: return
-        for sub in range(0x00, 0x08): self.vfd.icon_brightness(sub, lvl)
-        nxt = lvl + step
+        self.vfd.icon_brightness_bulk((0,)*8)
+    def _icon_wave_tick(self):
+        self.vfd.icon_brightness_bulk((self._wave_lvl,)*8)
+        nxt, step = self._wave_lvl + self._wave_step, self._wave_step
         if nxt > 6: nxt, step = 5, -1
         if nxt < 0: nxt, step = 1, +1
-        self.after(self.ms_icon_wave, lambda:self._icon_wave_tick(nxt, step))
+        self._wave_lvl, self._wave_step = nxt, step
 
     def _marquee_start(self):
         if self.loop_marquee: return
-        self.loop_marquee = True; self._marquee_offset = 0; self._marquee_tick()
+        self._marquee_offset = 0; self._marquee_last = None; self._loop_on("marquee")
     def _marquee_stop(self): self.loop_marquee = False
+    def _marquee_build(self):
+        # every 16-char window of the padded text, encoded once per text/line change
+        s = (" " * LINE_WIDTH + self.marquee_var.get() + " " * LINE_WIDTH).encode("ascii", "ignore")
+        head = (_CMD_LINE1 if self.marquee_line.get() == "0" else _CMD_LINE2) + _CMD_POS1
+        self._marquee_frames = [head + s[i:i+LINE_WIDTH] for i in range(len(s) - LINE_WIDTH + 1)]
+        self._marquee_last = None
     def _marquee_tick(self):
-        if not self.loop_marquee: return
-        line = 0 if self.marquee_line.get() == "0" else 1
-        raw = self.marquee_text.get() or ""
-        s = (" " * 16) + raw + (" " * 16)
-        i = self._marquee_offset % (len(s)-15)
-        chunk = s[i:i+16]
-        (self.vfd.mode_line1() if line==0 else self.vfd.mode_line2())
-        self.vfd.pos1(); self.vfd.write_text(chunk)
+        if self._marquee_frames is None: self._marquee_build()
+        frame = self._marquee_frames[self._marquee_offset % len(self._marquee_frames)]
         self._marquee_offset += 1
-        self.after(self.ms_marquee, self._marquee_tick)
+        if frame == self._marquee_last: return   # e.g. the all-blank gap between passes
+        if self.vfd.send(frame, "marquee", droppable=True): self._marquee_last = frame
 
     def _cylon_start(self):
         if self.loop_cylon: return
-        self.loop_cylon = True; self._cylon_tick(0, +1)
+        self._cylon_pos, self._cylon_step = 0, +1; self._loop_on("cylon")
     def _cylon_stop(self):
         self.loop_cylon = False; self.vfd.set_volume_level(0)
-    def _cylon_tick(self, pos, step):
-        if not self.loop_cylon: return
-        level = min(7, max(0, pos+1))
+    def _cylon_tick(self):
+        level = min(7, max(0, self._cylon_pos+1))
         self.vfd.set_volume_level(level)
-        nxt = pos + step
+        nxt, step = self._cylon_pos + self._cylon_step, self._cylon_step
         if nxt > 6: nxt, step = 5, -1
         if nxt < 0: nxt, step = 1, +1
-        self.after(self.ms_cylon, lambda:self._cylon_tick(nxt, step))
+        self._cylon_pos, self._cylon_step = nxt, step
 
     def _spin_start(self):
         if self.loop_spin: return
-        self.loop_spin = True; self._spin_state = 0
+        self._spin_state = 0
         self._spin_frames = [
             [0x00,0x08,0x08,0x08,0x7F,0x08,0x08,0x08,0x00],
             [0x00,0x00,0x00,0x7F,0x08,0x7F,0x00,0x00,0x00],
             [0x00,0x10,0x10,0x10,0x7F,0x10,0x10,0x10,0x00],
             [0x00,0x00,0x00,0x7F,0x08,0x7F,0x00,0x00,0x00],
         ]
-        self._spin_tick()
+        self._loop_on("spin")
     def _spin_stop(self):
         self.loop_spin = False; self.vfd.mm_clear()
     def _spin_tick(self):
-        if not self.loop_spin: return
         frame = self._spin_frames[self._spin_state % len(self._spin_frames)]
         self.vfd.mm_send_cols(frame)
         self._spin_state += 1
-        self.after(self.ms_spin, self._spin_tick)
 
     def _twinkle_start(self):
         if self.loop_twinkle: return
-        self.loop_twinkle = True; self._twinkle_cols = [0]*9; self._twinkle_tick()
+        self._twinkle_bits = 0; self._loop_on("twinkle")
     def _twinkle_stop(self):
         self.loop_twinkle = False; self.vfd.mm_clear()
     def _twinkle_tick(self):
-        if not self.loop_twinkle: return
-        cols = self._twinkle_cols[:]
+        # three random cells (0..62 each) from one draw
+        bits, n = self._twinkle_bits, random.randrange(63**3)
         for _ in range(3):
-            c = random.randint(0,8); r = random.randint(0,6)
-            cols[c] ^= (1 << r)
-        self._twinkle_cols = [c & 0x7F for c in cols]
-        self.vfd.mm_send_cols(self._twinkle_cols)
-        self.after(self.ms_twinkle, self._twinkle_tick)
+            n, i = divmod(n, 63)
+            bits ^= _CELL_BIT[i // 9][i % 9]
+        self._twinkle_bits = bits
+        self.vfd.mm_send_packed(bits)
 
     def _icon_carousel_start(self):
         if self.loop_icon_carousel: return
-        self.loop_icon_carousel = True; self._icon_carousel_idx = 0; self._icon_carousel_tick()
+        self.vfd.icon_brightness_bulk((0,)*8)
+        self._icon_carousel_idx, self._icon_carousel_prev = 0, None; self._loop_on("icon_carousel")
     def _icon_carousel_stop(self):
         self.loop_icon_carousel = False
-        for sub in range(0x00, 0x08): self.vfd.icon_brightness(sub, 0)
+        self.vfd.icon_brightness_bulk((0,)*8)
     def _icon_carousel_tick(self):
-        if not self.loop_icon_carousel: return
-        i = self._icon_carousel_idx % 8
-        for sub in range(0x00, 0x08): self.vfd.icon_brightness(sub, 0)
-        self.vfd.icon_brightness(0x00 + i, 6)
+        # only the icon going dark and the one lighting up change
+        i, prev = self._icon_carousel_idx % 8, self._icon_carousel_prev
+        self.vfd.icon_brightness_batch(((i, 6),) if prev is None else ((prev, 0), (i, 6)))
+        self._icon_carousel_prev = i
         self._icon_carousel_idx += 1
-        self.after(self.ms_icon_carousel, self._icon_carousel_tick)
 
     def _icon_pulse_start(self):
         if self.loop_icon_pulse: return
-        self.loop_icon_pulse = True; self._icon_pulse_phase = 0; self._icon_pulse_tick()
+        self._icon_pulse_phase = 0; self._loop_on("icon_pulse")
     def _icon_pulse_stop(self):
         self.loop_icon_pulse = False
-        for sub in range(0x00, 0x08): self.vfd.icon_brightness(sub, 0)
+        self.vfd.icon_brightness_bulk((0,)*8)
     def _icon_pulse_tick(self):
-        if not self.loop_icon_pulse: return
-        for i in range(8):
-            p = (self._icon_pulse_phase + i*2) % 12
-            lvl = p if p <= 6 else 12 - p
-            self.vfd.icon_brightness(0x00 + i, lvl)
+        ph = self._icon_pulse_phase
+        self.vfd.icon_brightness_bulk([min(p, 12 - p) for p in ((ph + i*2) % 12 for i in range(8))])
         self._icon_pulse_phase = (self._icon_pulse_phase + 1) % 12
-        self.after(self.ms_icon_pulse, self._icon_pulse_tick)
 
     def _email_blink_start(self):
         if self.loop_email_blink: return
-        self.loop_email_blink = True; self._email_state = 0; self._email_blink_tick()
+        self._email_state = 0; self._loop_on("email_blink")
     def _email_blink_stop(self):
         self.loop_email_blink = False
         self.vfd.set_email_white(False); self.vfd.set_email_red(False)
     def _email_blink_tick(self):
-        if not self.loop_email_blink: return
         st = self._email_state % 4
-        self.vfd.set_email_white(st in (1,3))
-        self.vfd.set_email_red(st in (2,3))
+        with self.vfd.batched():
+            self.vfd.set_email_white(st in (1,3))
+            self.vfd.set_email_red(st in (2,3))
         self._email_state += 1
-        self.after(self.ms_email_blink, self._email_blink_tick)
 
     def _record_blink_start(self):
         if self.loop_record_blink: return
-        self.loop_record_blink = True; self._rec_on = False; self._record_blink_tick()
+        self._rec_on = False; self._loop_on("record_blink")
     def _record_blink_stop(self):
         self.loop_record_blink = False; self.vfd.set_record(False)
     def _record_blink_tick(self):
-        if not self.loop_record_blink: return
         self._rec_on = not self._rec_on
         self.vfd.set_record(self._rec_on)
-        self.after(self.ms_record_blink, self._record_blink_tick)
 
     def _text_bounce_start(self):
         if self.loop_text_bounce: return
-        self.loop_text_bounce = True
-        self._bounce_dir = +1; self._bounce_pos = 0; self._text_bounce_tick()
+        self._bounce_i = 0; self._loop_on("text_bounce")
     def _text_bounce_stop(self): self.loop_text_bounce = False
+    def _text_bounce_build(self):
+        # one ping-pong cycle of positions 0..n..1, encoded once per text/line change
+        s = (self.bounce_var.get() or " ").strip()[:LINE_WIDTH].encode("ascii", "ignore")
+        n = LINE_WIDTH - len(s)
+        positions = list(range(n + 1)) + list(range(n - 1, 0, -1))
+        head = (_CMD_LINE1 if self.bounce_line.get() == "0" else _CMD_LINE2) + _CMD_POS1
+        self._bounce_frames = [head + b" " * p + s + b" " * (n - p) for p in positions]
     def _text_bounce_tick(self):
-        if not self.loop_text_bounce: return
-        line = 0 if self.bounce_line.get() == "0" else 1
-        raw  = (self.bounce_text.get() or " ").strip()
-        s    = raw[:16]
-        width= 16; n = max(0, width - len(s))
-        chunk = (" " * self._bounce_pos) + s + (" " * (n - self._bounce_pos))
-        (self.vfd.mode_line1() if line==0 else self.vfd.mode_line2())
-        self.vfd.pos1(); self.vfd.write_text(chunk[:16])
-        if n > 0:
-            self._bounce_pos += self._bounce_dir
-            if self._bounce_pos >= n: self._bounce_pos, self._bounce_dir = n, -1
-            if self._bounce_pos <= 0: self._bounce_pos, self._bounce_dir = 0, +1
-        self.after(self.ms_text_bounce, self._text_bounce_tick)
+        if self._bounce_frames is None: self._text_bounce_build()
+        frame = self._bounce_frames[self._bounce_i % len(self._bounce_frames)]
+        self.vfd.send(frame, "bounce", droppable=True)
+        self._bounce_i += 1
 
     def _rain_start(self):
         if self.loop_mini_rain: return
-        self.loop_mini_rain = True; self._rain_drops = []; self._rain_tick()
+        self._rain_board = 0; self._loop_on("mini_rain")
     def _rain_stop(self):
-        self.loop_mini_rain = False; self.vfd.mm_clear(); self._rain_drops = []
+        self.loop_mini_rain = False; self.vfd.mm_clear(); self._rain_board = 0
     def _rain_tick(self):
-        if not self.loop_mini_rain: return
-        if random.random() < self._rain_p:
-            self._rain_drops.append((0, random.randint(0,8)))
-        new = []
-        for (r,c) in self._rain_drops:
-            r2 = r + 1
-            if r2 <= 6: new.append((r2,c))
-        self._rain_drops = new
-        cols = [0]*9
-        for (r,c) in self._rain_drops:
-            cols[c] |= (1 << r)
-        self.vfd.mm_send_cols(cols)
-        self.after(self.ms_mini_rain, self._rain_tick)
+        # drops live on the 63-bit board; one 9-bit shift moves them all down a
+        # row and drops the bottom row, then a new drop may appear on top
+        board = (self._rain_board << 9) & _BOARD_FULL
+        if random.random() < self._rain_p: board |= 1 << random.randrange(9)
+        self._rain_board = board
+        self.vfd.mm_send_board(board)
 
     def _snake_start(self):
         if self.loop_mini_snake: return
-        self.loop_mini_snake = True; self._snake_idx = 0; self._snake_tick()
+        self._snake_idx = 0; self._loop_on("mini_snake")
     def _snake_stop(self):
         self.loop_mini_snake = False; self.vfd.mm_clear()
     def _snake_tick(self):
-        if not self.loop_mini_snake: return
         head_idx = self._snake_idx
-        tail_idx = max(0, head_idx - self._snake_len)
-        segment = []
-        for k in range(tail_idx, head_idx+1):
-            (r,c) = self._snake_path[k % len(self._snake_path)]
-            segment.append((r,c))
-        cols = [0]*9
-        for (r,c) in segment:
-            cols[c] |= (1 << r)
-        self.vfd.mm_send_cols(cols)
+        bits = 0
+        for k in range(max(0, head_idx - self._snake_len), head_idx+1):
+            r, c = self._path_cell(k)
+            bits |= _CELL_BIT[r][c]
+        self.vfd.mm_send_packed(bits)
         self._snake_idx += 1
-        self.after(self.ms_mini_snake, self._snake_tick)
 
     # ---------- NEW v8 mini-matrix modes ----------
     # Bouncy ball
     def _ball_start(self):
         self._stop_all_mm()
-        self.loop_ball = True; self._ball_tick()
+        self._loop_on("ball")
     def _ball_stop(self):
         self.loop_ball = False; self.vfd.mm_clear()
     def _ball_tick(self):
-        if not self.loop_ball: return
         r,c = self._ball_pos
         vr,vc = self._ball_vel
         r2, c2 = r+vr, c+vc
         if r2 < 0 or r2 > 6: vr = -vr; r2 = r+vr
         if c2 < 0 or c2 > 8: vc = -vc; c2 = c+vc
         self._ball_pos = [r2,c2]; self._ball_vel = [vr,vc]
-        cols = [0]*9
-        cols[c2] |= (1 << r2)
-        self.vfd.mm_send_cols(cols)
-        self.after(self.ms_ball, self._ball_tick)
+        self.vfd.mm_send_packed(_CELL_BIT[r2][c2])
 
     # Stickman run (scroll frames across)
     def _stickman_start(self):
         self._stop_all_mm()
-        self.loop_stickman = True; self._stick_col = 9; self._stick_idx = 0; self._stickman_tick()
+        self._stick_pos = 0; self._loop_on("stickman")
     def _stickman_stop(self):
         self.loop_stickman = False; self.vfd.mm_clear()
     def _stickman_tick(self):
-        if not self.loop_stickman: return
-        frame = self._stick_frames[self._stick_idx % len(self._stick_frames)]  # 9-wide frame
-        # slide from right to left
-        self._stick_col -= 1
-        cols = [0]*9
-        for i in range(9):
-            src = i - (9 - self._stick_col)
-            if 0 <= src < 9:
-                cols[i] = frame[src]
-        self.vfd.mm_send_cols(cols)
-        if self._stick_col <= 0:
-            self._stick_col = 9
-            self._stick_idx += 1
-        self.after(self.ms_stickman, self._stickman_tick)
+        self.vfd.mm_send_packed(self._stick_stream[self._stick_pos])
+        self._stick_pos = (self._stick_pos + 1) % len(self._stick_stream)
 
     # Game of Life
     def _gol_start(self):
         self._stop_all_mm()
-        self.loop_gol = True; self._gol_tick()
+        self._loop_on("gol")
     def _gol_stop(self):
         self.loop_gol = False; self.vfd.mm_clear()
     def _gol_randomize(self):
         self._gol_grid = self._rand_grid()
     def _gol_tick(self):
-        if not self.loop_gol: return
-        cols = [0]*9
-        for r in range(7):
-            for c in range(9):
-                if self._gol_grid[r][c]:
-                    cols[c] |= (1 << r)
-        self.vfd.mm_send_cols(cols)
+        self.vfd.mm_send_board(self._gol_grid)
         self._gol_grid = self._gol_step(self._gol_grid)
-        self.after(self.ms_gol, self._gol_tick)
 
     # Clock bars (H/M/S bar heights across 3+3+3 columns)
     def _clock_bars_start(self):
         self._stop_all_mm()
-        self.loop_clock_bars = True; self._clock_bars_tick()
+        self._clock_bars_sec = -1; self._loop_on("clock_bars")
     def _clock_bars_stop(self):
         self.loop_clock_bars = False; self.vfd.mm_clear()
     def _clock_bars_tick(self):
-        if not self.loop_clock_bars: return
-        now = datetime.datetime.now()
-        H, M, S = now.hour, now.minute, now.second
-        def bars(val, maxval):
-            h = int(round((val/maxval)*7))
-            col = 0
-            for i in range(h):
-                col |= (1 << i)
-            return [col]*3
-        cols = bars(H, 23) + bars(M, 59) + bars(S, 59)
-        self.vfd.mm_send_cols(cols[:9])
-        self.after(self.ms_clock_bars, self._clock_bars_tick)
+        # the picture only changes when the second does
+        t = time.localtime()
+        if t.tm_sec == self._clock_bars_sec: return
+        self._clock_bars_sec = t.tm_sec
+        h, m, sec = (_BAR_COL[round(v / top * 7)] for v, top in
+                     ((t.tm_hour, 23), (t.tm_min, 59), (min(t.tm_sec, 59), 59)))
+        self.vfd.mm_send_cols([h]*3 + [m]*3 + [sec]*3)
 
     # ---------- Playable Snake Game ----------
     def _snake_game_start(self):
         self._stop_all_mm()
-        self.loop_snake_game = True
         self._g_paused = False
         self._show_snake_score()
-        self._snake_game_tick()
+        self._loop_on("snake_game")
 
     def _snake_game_toggle_pause(self):
         if not self.loop_snake_game: return
@@ -1086,16 +1424,14 @@ class App(tk.Tk):
         self._status_text("Paused" if self._g_paused else "Running")
 
     def _snake_game_reset(self):
-        self._g_snake = [(3,2),(3,1),(3,0)]
+        self._g_snake = collections.deque([(3,2),(3,1),(3,0)])
+        self._g_snake_cells = set(self._g_snake)
         self._g_dir = (0,1); self._g_pending = (0,1)
-        self._g_food = self._rand_food(self._g_snake)
+        self._g_food = self._rand_food(self._g_snake_cells)
         self._g_score = 0
         self._show_snake_score()
         self.vfd.mm_clear()
 
-    def _set_snake_game_fps(self, fps):
-        self.ms_snake_game = self._fps_to_ms(fps)
-
     def _snake_key(self, dr, dc):
         # ignore reverse direction
         pr, pc = self._g_dir
@@ -1103,42 +1439,43 @@ class App(tk.Tk):
         self._g_pending = (dr,dc)
 
     def _snake_game_tick(self):
-        if not self.loop_snake_game: return
         if not self._g_paused:
-            self._g_dir = self._g_pending
-            head = self._g_snake[0]
-            nr = head[0] + self._g_dir[0]
-            nc = head[1] + self._g_dir[1]
-            # wall collision -> game over
-            if not (0 <= nr <= 6 and 0 <= nc <= 8) or (nr,nc) in self._g_snake:
-                self._status_text("Game Over!")
-                self.loop_snake_game = False
-                return
-            new_head = (nr,nc)
-            self._g_snake = [new_head] + self._g_snake
-            if new_head == self._g_food:
-                self._g_score += 1
-                self._g_food = self._rand_food(self._g_snake)
-                self._show_snake_score()
-            else:
-                self._g_snake.pop()  # move
-
-            cols = [0]*9
-            # draw food
-            cols[self._g_food[1]] |= (1 << self._g_food[0])
-            # draw snake
-            for (r,c) in self._g_snake:
-                cols[c] |= (1 << r)
-            self.vfd.mm_send_cols(cols)
-        self.after(self.ms_snake_game, self._snake_game_tick)
+            with self.vfd.batched():
+                self._g_dir = self._g_pending
+                head = self._g_snake[0]
+                nr = head[0] + self._g_dir[0]
+                nc = head[1] + self._g_dir[1]
+                new_head = (nr,nc)
+                eating = new_head == self._g_food
+                # wall or body collision -> game over; the tail cell is free
+                # to enter unless we eat (then the tail stays put)
+                if not (0 <= nr <= 6 and 0 <= nc <= 8) or (
+                        new_head in self._g_snake_cells and (eating or new_head != self._g_snake[-1])):
+                    self._status_text("Game Over!")
+                    self.loop_snake_game = False
+                    return
+                if not eating:
+                    self._g_snake_cells.discard(self._g_snake.pop())  # move
+                self._g_snake.appendleft(new_head); self._g_snake_cells.add(new_head)
+                if eating:
+                    self._g_score += 1
+                    self._g_food = self._rand_food(self._g_snake_cells)
+                    self._show_snake_score()
+
+                fr, fc = self._g_food
+                bits = _CELL_BIT[fr][fc]   # food
+                for (r,c) in self._g_snake:
+                    bits |= _CELL_BIT[r][c]
+                self.vfd.mm_send_packed(bits)
 
     def _show_snake_score(self):
         self.snake_score_lbl.config(text=f"Score: {self._g_score}")
-        self.vfd.mode_line1(); self.vfd.pos1(); self.vfd.write_text(f"SNAKE SCORE:{self._g_score:2d}"[:16])
-        self.vfd.mode_line2(); self.vfd.pos1(); self.vfd.write_text("Arrows / D-pad   "[:16])
+        with self.vfd.batched():
+            self.vfd.draw_text_line(0, f"SNAKE SCORE:{self._g_score:2d}")
+            self.vfd.draw_text_line(1, "Arrows / D-pad  ")
 
     def _status_text(self, s):
-        self.vfd.mode_line2(); self.vfd.pos1(); self.vfd.write_text((s + " " * 16)[:16])
+        self.vfd.draw_text_line(1, s.ljust(LINE_WIDTH))
 
     # ---------- Utility (MM stop & helpers) ----------
     def _stop_all_mm(self):
@@ -1150,27 +1487,55 @@ class App(tk.Tk):
         self.loop_snake_game = False
         self.vfd.mm_clear()
 
+    # Game of Life board: one int, cell (r,c) at bit r*9 + c
     def _rand_grid(self):
-        return [[1 if random.random() < 0.3 else 0 for _ in range(9)] for __ in range(7)]
+        # ~30% density from six 63-bit draws: P(a&b | c&d&e&f) = 1/4 + 1/16 - 1/64 = 19/64
+        a, b, c, d, e, f = (random.getrandbits(63) for _ in range(6))
+        return (a & b) | (c & d & e & f)
 
     def _gol_step(self, g):
-        out = [[0]*9 for _ in range(7)]
-        for r in range(7):
-            for c in range(9):
-                n = 0
-                for dr in (-1,0,1):
-                    for dc in (-1,0,1):
-                        if dr==0 and dc==0: continue
-                        rr, cc = r+dr, c+dc
-                        if 0 <= rr < 7 and 0 <= cc < 9 and g[rr][cc]: n += 1
-                if g[r][c] and (n==2 or n==3): out[r][c]=1
-                elif (not g[r][c]) and (n==3): out[r][c]=1
-        return out
-
-    def _rand_food(self, snake):
-        free = [(r,c) for r in range(7) for c in range(9) if (r,c) not in snake]
+        # Bit-parallel B3/S23 on the whole board, counted separably: first the
+        # horizontal 3-cell sum (self included) of every cell as a 2-bit slice
+        # (h0, h1), then the vertical sum of three such slices (row shifts of
+        # 9 bits). With the centre counted, a cell lives next tick if the 3x3
+        # total is 3, or 4 and it is alive.
+        a, b = (g << 1) & _BOARD_NOT_C0, (g >> 1) & _BOARD_NOT_C8   # west / east neighbour
+        ab = a ^ b
+        h0, h1 = ab ^ g, (a & b) | (g & ab)
+        a0, a1 = (h0 << 9) & _BOARD_FULL, (h1 << 9) & _BOARD_FULL   # row above
+        c0, c1 = h0 >> 9, h1 >> 9                                # row below
+        t0 = a0 ^ h0 ^ c0                                # total, 1s bit
+        k0 = (a0 & h0) | (c0 & (a0 ^ h0))                # carry into 2s
+        x = a1 ^ h1 ^ c1; y = (a1 & h1) | (c1 & (a1 ^ h1))
+        z0 = x ^ k0; z1 = x & k0                         # 2s count = z0 + 2*(y + z1)
+        return ((t0 & z0 & ~y) | (~t0 & ~z0 & (y ^ z1) & g)) & _BOARD_FULL
+
+    def _path_cell(self, i):
+        # i-th cell of the boustrophedon path (row 0 left->right, row 1 back, ...)
+        r, i9 = divmod(i % 63, 9)
+        return r, (i9 if r % 2 == 0 else 8 - i9)
+
+    def _rand_food(self, taken):
+        # rejection sampling while the board is mostly free; list the free
+        # cells only once the snake covers more than 50 of the 63
+        if len(taken) <= 50:
+            while True:
+                cell = (random.randrange(7), random.randrange(9))
+                if cell not in taken: return cell
+        free = [(r,c) for r in range(7) for c in range(9) if (r,c) not in taken]
         return random.choice(free) if free else (3,4)
 
+    def _build_stickman_stream(self, frames):
+        # every picture the run shows, in order, as packed mini-matrix frames:
+        # each sprite frame enters shifted one column and slides a column per
+        # tick until it is gone (9 pictures per sprite frame)
+        stream = []
+        for frame in frames:
+            for k in range(1, 10):
+                cols = [0]*k + frame[:9-k]
+                stream.append(sum(col << (8*c) for c, col in enumerate(cols)))
+        return stream
+
     def _build_stickman_frames(self):
         # 4 frames; each 9 columns; bit0 = top row
         # Simple 3-wide stickman centered; rest columns zero.
@@ -1238,106 +1603,178 @@ class App(tk.Tk):
     def _build_log(self, parent):
         f = ttk.LabelFrame(parent, text="Log")
         f.pack(fill="both", expand=True, padx=8, pady=8)
+        self.log_enabled = tk.BooleanVar(value=True)
+        tk.Checkbutton(f, text="Log TX frames", variable=self.log_enabled,
+                       command=lambda:setattr(self.vfd, "log_tx", self.log_enabled.get())
+                       ).pack(anchor="w", padx=6)
         self.logbox = tk.Text(f, height=16, wrap="none", bg="#ffffff", fg="#111111", insertbackground="#111111")
         self.logbox.pack(fill="both", expand=True, padx=6, pady=6)
         self.log("Ready.")
 
     def log(self, s: str):
-        self.logbox.insert("end", s+"\n"); self.logbox.see("end")
+        self._log_queue.append(s)
+
+    def _flush_log(self):
+        q = self._log_queue
+        if q and hasattr(self, "logbox"):
+            lines = []
+            while q: lines.append(q.popleft())
+            self.logbox.insert("end", "\n".join(lines) + "\n"); self.logbox.see("end")
+        self.after(200, self._flush_log)
 
     # ---------- System meters (psutil) ----------
+    # One background thread samples the counters for all meters, maps them to
+    # meter levels and publishes those in self._levels; meter ticks on the Tk
+    # thread only hand that level to the VFD, whose icon cache skips repeats
+    # (and is reset on connect/RESET, so a steady level gets redrawn).
+    def _meters_active(self):
+        return self.loop_net_meter or self.loop_disk_meter or self.loop_mem_meter
+
+    def _meter_reset(self, kind):
+        # on start/stop: show 0 rather than the level from the meter's last
+        # run, and have the sampler drop that meter's baseline and state
+        with self._sampler_lock:
+            self._meter_resets.add(kind)
+            self._levels = {**self._levels, kind: 0}
+
+    def _sampler_ensure(self):
+        with self._sampler_lock:
+            if self._sampler_thread is None:
+                self._sampler_thread = threading.Thread(target=self._sampler_loop, daemon=True)
+                self._sampler_thread.start()
+
+    def _sampler_loop(self):
+        try: self._sampler_run()
+        except Exception as e: self.log(f"[error] meters: {e}")
+        finally:
+            # however the thread ends, let _sampler_ensure start a new one
+            with self._sampler_lock:
+                if self._sampler_thread is threading.current_thread():
+                    self._sampler_thread = None
+
+    def _sampler_run(self):
+        prev = {}   # counter -> (time, bytes) at its last sample
+
+        def rate(key, now, total):
+            # bytes/s since the last sample of this counter (0 on the first,
+            # and on a counter wrap/reset, which shows up as a negative delta);
+            # integer ns clock and integer math throughout
+            last = prev.get(key); prev[key] = (now, total)
+            if not last or total < last[1]: return 0
+            return (total - last[1]) * 1_000_000_000 // max(1_000_000, now - last[0])
+
+        # procfs on Linux, psutil where /proc isn't there (or can't be parsed)
+        net_bytes = _pick_reader(_proc_net_bytes, _psutil_net_bytes)
+        disk_bytes = _pick_reader(_proc_disk_bytes, _psutil_disk_bytes)
+        disk_ewma = disk_lvl = 0   # smoothed disk bytes/s and the level shown for it
+        # RAM usage moves slowly: each sample with an unchanged level doubles
+        # the number of passes until the next one (1, 2, 4, 8... capped at
+        # MEM_BACKOFF_S); any change drops straight back to every pass
+        mem_lvl, mem_stable, mem_wait = -1, 0, 0
+        mem_max_wait = max(0, int(MEM_BACKOFF_S / SAMPLE_S) - 1)
+        period = int(SAMPLE_S * 1_000_000_000)
+        due = time.monotonic_ns()
+        last_err = None
+
+        while True:
+            with self._sampler_lock:
+                if not self._meters_active():
+                    self._sampler_thread = None; return
+                resets, self._meter_resets = self._meter_resets, set()
+            # a meter that was stopped/started starts over: no rate baseline,
+            # no smoothing or backoff state carried from its last run
+            if "net" in resets: prev.pop("net", None)
+            if "disk" in resets: prev.pop("disk", None); disk_ewma = disk_lvl = 0
+            if "mem" in resets: mem_lvl, mem_stable, mem_wait = -1, 0, 0
+            now = time.monotonic_ns()
+            # fixed timestep like the master scheduler: the next pass is due one
+            # period after this one was, so sampling time doesn't stretch the
+            # interval; after a stall (suspend, slow procfs) restart from now
+            due = due + period if due + period > now else now + period
+            # only query what a running meter shows; a counter that is not
+            # sampled forgets its baseline so a restart doesn't average a gap
+            try:
+                levels = {"net": 0, "disk": 0, "mem": 0}
+                if self.loop_net_meter:
+                    # map bits/s to 0..3 (conservative thresholds; tweak _NET_THRESH if you want)
+                    levels["net"] = bisect.bisect_right(_NET_THRESH, rate("net", now, net_bytes()) * 8)
+                else: prev.pop("net", None)
+                if self.loop_disk_meter:
+                    # map smoothed activity to brightness 0..6; bursty I/O would
+                    # otherwise flick the HDD icon between neighbouring levels
+                    disk_ewma += (rate("disk", now, disk_bytes()) - disk_ewma) >> _DISK_EWMA_SHIFT
+                    levels["disk"] = disk_lvl = _hyst_level(_DISK_THRESH, disk_ewma, disk_lvl)
+                else:
+                    prev.pop("disk", None); disk_ewma = disk_lvl = 0
+                if self.loop_mem_meter:
+                    if mem_wait: mem_wait -= 1
+                    else:
+                        # map 0..100% → 0..6
+                        lvl = _MEM_LVL[max(0, min(100, round(psutil.virtual_memory().percent)))]
+                        mem_stable = mem_stable + 1 if lvl == mem_lvl else 0
+                        mem_lvl = lvl
+                        mem_wait = min((1 << min(mem_stable, 4)) - 1, mem_max_wait)
+                    levels["mem"] = mem_lvl
+                else: mem_lvl, mem_stable, mem_wait = -1, 0, 0
+                with self._sampler_lock:
+                    # a meter reset while this pass ran keeps its 0 until the next one
+                    for kind in self._meter_resets: levels[kind] = 0
+                    self._levels = levels   # swapped whole, so readers never see a half update
+            except Exception as e:
+                # one bad read (procfs, psutil) must not stop every meter: log
+                # it once per distinct error, drop the rate baselines, carry on
+                prev.clear()
+                if str(e) != last_err: self.log(f"[error] meters: {e}")
+                last_err = str(e)
+            else: last_err = None
+            time.sleep(max(0, due - time.monotonic_ns()) / 1_000_000_000)
+
     def _net_meter_start(self):
         if not HAVE_PSUTIL:
             messagebox.showwarning("psutil", "Install psutil: pip install psutil")
             return
         if self.loop_net_meter: return
-        self.loop_net_meter = True
-        io = psutil.net_io_counters()
-        self._net_prev_bytes = io.bytes_recv + io.bytes_sent
-        self._net_prev_t = time.time()
-        self._net_meter_tick()
+        self._meter_reset("net")
+        self._loop_on("net_meter"); self._sampler_ensure()
 
     def _net_meter_stop(self):
-        self.loop_net_meter = False
+        self.loop_net_meter = False; self._meter_reset("net")
         self.vfd.set_wifi_level(0)
 
     def _net_meter_tick(self):
-        if not self.loop_net_meter: return
-        io = psutil.net_io_counters()
-        now = time.time()
-        cur = io.bytes_recv + io.bytes_sent
-        dt = max(1e-3, now - self._net_prev_t)
-        bps = (cur - self._net_prev_bytes) * 8.0 / dt  # bits per second
-
-        # map to 0..3 (conservative thresholds; tweak if you want)
-        if bps < 64_000:       lvl = 0
-        elif bps < 512_000:    lvl = 1
-        elif bps < 5_000_000:  lvl = 2
-        else:                  lvl = 3
-
-        self.vfd.set_wifi_level(lvl)
-        self._net_prev_bytes = cur
-        self._net_prev_t = now
-        self.after(self.ms_net_meter, self._net_meter_tick)
+        self.vfd.set_wifi_level(self._levels["net"])
 
     def _disk_meter_start(self):
         if not HAVE_PSUTIL:
             messagebox.showwarning("psutil", "Install psutil: pip install psutil")
             return
         if self.loop_disk_meter: return
-        self.loop_disk_meter = True
-        dio = psutil.disk_io_counters()
-        self._disk_prev = (dio.read_bytes + dio.write_bytes)
-        self._disk_prev_t = time.time()
-        self._disk_meter_tick()
+        self._meter_reset("disk")
+        self._loop_on("disk_meter"); self._sampler_ensure()
 
     def _disk_meter_stop(self):
-        self.loop_disk_meter = False
+        self.loop_disk_meter = False; self._meter_reset("disk")
         # HDD icon brightness → 0
         self.vfd.icon_brightness(0x00, 0)
 
     def _disk_meter_tick(self):
-        if not self.loop_disk_meter: return
-        dio = psutil.disk_io_counters()
-        now = time.time()
-        cur = dio.read_bytes + dio.write_bytes
-        dt = max(1e-3, now - self._disk_prev_t)
-        Bps = (cur - self._disk_prev) / dt  # bytes/s
-
-        # map activity to brightness 0..6
-        if   Bps < 64_000:        lvl = 0
-        elif Bps < 256_000:       lvl = 1
-        elif Bps < 1_000_000:     lvl = 2
-        elif Bps < 4_000_000:     lvl = 3
-        elif Bps < 16_000_000:    lvl = 4
-        elif Bps < 64_000_000:    lvl = 5
-        else:                     lvl = 6
-
-        self.vfd.icon_brightness(0x00, lvl)  # HDD brightness
-        self._disk_prev = cur
-        self._disk_prev_t = now
-        self.after(self.ms_disk_meter, self._disk_meter_tick)
+        self.vfd.icon_brightness(0x00, self._levels["disk"])   # HDD brightness
 
     def _mem_meter_start(self):
         if not HAVE_PSUTIL:
             messagebox.showwarning("psutil", "Install psutil: pip install psutil")
             return
         if self.loop_mem_meter: return
-        self.loop_mem_meter = True
-        self._mem_meter_tick()
+        self._meter_reset("mem")
+        self._loop_on("mem_meter"); self._sampler_ensure()
 
     def _mem_meter_stop(self):
-        self.loop_mem_meter = False
+        self.loop_mem_meter = False; self._meter_reset("mem")
         # USB icon brightness → 0
         self.vfd.icon_brightness(0x03, 0)
 
     def _mem_meter_tick(self):
-        if not self.loop_mem_meter: return
-        vm = psutil.virtual_memory()
-        # map 0..100% → 0..6
-        lvl = max(0, min(6, int(round(vm.percent / 100.0 * 6))))
-        self.vfd.icon_brightness(0x03, lvl)  # USB brightness used as "RAM" meter
-        self.after(self.ms_mem_meter, self._mem_meter_tick)
+        self.vfd.icon_brightness(0x03, self._levels["mem"])   # USB brightness used as "RAM" meter
 
 if __name__ == "__main__":
     App().mainloop()